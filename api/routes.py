@@ -2,7 +2,7 @@ import logging
 import threading
 import time
 import uuid
-from collections import deque
+from collections import Counter, deque
 from datetime import datetime
 
 import yaml
@@ -80,12 +80,13 @@ def append_order_book_snapshot(symbol, order_book):
             {"time": now, "snapshot": snapshot}
         )
 
-    # Calculate and store mid price and spread
-    best_bid = order_book.get_best_bid()
-    best_ask = order_book.get_best_ask()
-    if best_bid and best_ask:
-        mid = (best_bid["price"] + best_ask["price"]) / 2
-        spread = best_ask["price"] - best_bid["price"]
+    # Calculate and store mid price and spread from the snapshot's top levels,
+    # which are the same best bid/ask the book would return
+    bids = snapshot.get("bids", [])
+    asks = snapshot.get("asks", [])
+    if bids and asks:
+        mid = (bids[0]["price"] + asks[0]["price"]) / 2
+        spread = asks[0]["price"] - bids[0]["price"]
     else:
         mid = None
         spread = None
@@ -93,14 +94,10 @@ def append_order_book_snapshot(symbol, order_book):
         {"time": now, "mid": mid, "spread": spread}
     )
 
-    # Calculate and store total liquidity at top N levels
-    total_liquidity = 0
-    if snapshot:
-        bids = snapshot.get("bids", [])
-        asks = snapshot.get("asks", [])
-        total_liquidity = sum(level["quantity"] for level in bids) + sum(
-            level["quantity"] for level in asks
-        )
+    # Total liquidity at top N levels: each side's last running cumulative
+    total_liquidity = (bids[-1]["cumulative"] if bids else 0) + (
+        asks[-1]["cumulative"] if asks else 0
+    )
     trading_state["liquidity_history"][symbol].append(
         {"time": now, "liquidity": total_liquidity}
     )
@@ -111,6 +108,28 @@ def append_order_book_snapshot(symbol, order_book):
             trading_state[key][symbol].pop(0)
 
 
+def has_min_depth(book_side, min_levels, min_qty):
+    """
+    Check one side of a book has at least min_levels price levels and min_qty in total.
+    Stops summing as soon as min_qty is reached instead of walking every order.
+    Args:
+        book_side (dict): Price -> orders mapping (an OrderBook's bids or asks).
+        min_levels (int): Minimum number of price levels.
+        min_qty (int): Minimum total quantity across all levels.
+    Returns:
+        bool: True if both thresholds are met.
+    """
+    if len(book_side) < min_levels:
+        return False
+    total = 0
+    for orders in book_side.values():
+        for order in orders:
+            total += order["qty"]
+            if total >= min_qty:
+                return True
+    return total >= min_qty
+
+
 def auto_update_order_books():
     """
     Background thread function to keep order books updated, reseed synthetic depth,
@@ -180,22 +199,8 @@ def auto_update_order_books():
                 )
 
                 # Check if order book needs reseeding (insufficient liquidity or time-based)
-                bids_ok = (
-                    len(order_book.bids) >= min_levels
-                    and sum(
-                        sum(order["qty"] for order in q)
-                        for q in order_book.bids.values()
-                    )
-                    >= min_qty
-                )
-                asks_ok = (
-                    len(order_book.asks) >= min_levels
-                    and sum(
-                        sum(order["qty"] for order in q)
-                        for q in order_book.asks.values()
-                    )
-                    >= min_qty
-                )
+                bids_ok = has_min_depth(order_book.bids, min_levels, min_qty)
+                asks_ok = has_min_depth(order_book.asks, min_levels, min_qty)
                 now = time.time()
                 need_reseed = not bids_ok or not asks_ok
                 time_for_reseed = now - last_reseed_time[symbol] > reseed_interval
@@ -222,9 +227,9 @@ def auto_update_order_books():
                     try:
                         for order in strategy.generate_orders():
                             trades = matching_engine.match_order(
-                                side=order["side"],
-                                price=order["price"],
-                                quantity=order["quantity"],
+                                side=order.side,
+                                price=order.price,
+                                quantity=order.quantity,
                                 order_id=str(uuid.uuid4()),
                                 source=strategy.source_name,
                             )
@@ -386,6 +391,7 @@ def cancel_mystrategy_orders():
                     book_side[price] = deque(new_queue)
                 else:
                     del book_side[price]
+        order_book.refresh_top()
         decoded_removed_orders = decode_bytes(removed_orders)
         return jsonify({"status": "success", "removed_orders": decoded_removed_orders})
 
@@ -528,6 +534,11 @@ def strategy_status():
     symbol = request.args.get("symbol") or trading_state["current_symbol"]
     with state_lock:
         strategies = strategy_instances.get(symbol, {})
+        # Count per-symbol trades by source in one pass (for accurate trade counts)
+        # rather than filtering the whole trade list once per strategy
+        trade_counts = Counter(
+            t.get("source") for t in trading_state["trades"].get(symbol, [])
+        )
         status = {}
         for name, strat in strategies.items():
             # Get current market price for unrealised PnL
@@ -545,10 +556,7 @@ def strategy_status():
             max_inventory = getattr(strat, "max_inventory", 1)
             inventory = getattr(strat, "inventory", 0)
             win_rate = strat.get_win_rate() if hasattr(strat, "get_win_rate") else 0.0
-            # Use per-symbol trades if available (for accurate trade count)
-            symbol_trades = trading_state["trades"].get(symbol, [])
-            strat_trades = [t for t in symbol_trades if t.get("source") == name]
-            total_trades = len(strat_trades)
+            total_trades = trade_counts[name]
             # Calculate metrics for the strategy
             status[name] = {
                 "inventory": inventory,
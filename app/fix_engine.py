@@ -3,6 +3,23 @@ import time
 
 import simplefix
 
+# FIX Side (54) codes accepted on new orders; built once rather than per call
+VALID_SIDES = frozenset(("1", "2"))
+# simplefix stores tags as bytes; an int tag is re-encoded via str() on every get()
+TAG_MSG_SEQ_NUM = b"34"
+# Session headers (BeginString, SenderCompID, TargetCompID), pre-encoded once so
+# append_pair takes its bytes fast path instead of converting each field per message
+OUTBOUND_HEADER = (
+    (b"8", b"FIX.4.4"),
+    (b"49", b"MY_COMPANY"),
+    (b"56", b"EXCHANGE"),
+)
+EXCHANGE_HEADER = (
+    (b"8", b"FIX.4.4"),
+    (b"49", b"EXCHANGE"),
+    (b"56", b"MY_COMPANY"),
+)
+
 
 class FixEngine:
     def __init__(self, symbol=None, heartbeat_interval=30):
@@ -45,16 +62,15 @@ class FixEngine:
             bytes: Encoded FIX heartbeat message.
         """
         msg = simplefix.FixMessage()
-        msg.append_pair(8, "FIX.4.4")  # BeginString: FIX version
-        msg.append_pair(49, "MY_COMPANY")  # SenderCompID
-        msg.append_pair(56, "EXCHANGE")  # TargetCompID
+        for tag, value in OUTBOUND_HEADER:  # BeginString, SenderCompID, TargetCompID
+            msg.append_pair(tag, value)
         msg.append_pair(34, self.seq_num)  # MsgSeqNum
         msg.append_pair(35, "0")  # MsgType: Heartbeat
         msg.append_utc_timestamp(52)  # SendingTime
 
         try:
             raw_msg = msg.encode()
-            self._log_heartbeat(msg, incoming=False)  # Log the outgoing heartbeat
+            self._log_heartbeat(raw_msg, incoming=False)  # Log the outgoing heartbeat
             self.seq_num += 1  # Increment sequence number after sending
             return raw_msg
         except Exception as e:
@@ -90,7 +106,8 @@ class FixEngine:
                 f"Symbol (55) must be a non-empty string up to 8 characters. Got: {symbol}"
             )
         # Validate side
-        if str(side) not in {"1", "2"}:
+        side = str(side)
+        if side not in VALID_SIDES:
             raise ValueError(f"Side (54) must be '1' (Buy) or '2' (Sell). Got: {side}")
         # Validate price
         try:
@@ -111,22 +128,23 @@ class FixEngine:
 
         # Construct the FIX NewOrderSingle message
         msg = simplefix.FixMessage()
-        msg.append_pair(8, "FIX.4.4")  # BeginString
-        msg.append_pair(49, "MY_COMPANY")  # SenderCompID
-        msg.append_pair(56, "EXCHANGE")  # TargetCompID
+        for tag, value in OUTBOUND_HEADER:  # BeginString, SenderCompID, TargetCompID
+            msg.append_pair(tag, value)
         msg.append_pair(34, self.seq_num)  # MsgSeqNum
         msg.append_pair(35, "D")  # MsgType: NewOrderSingle
         msg.append_pair(11, cl_ord_id)  # ClOrdID
         msg.append_pair(55, symbol)  # Symbol
-        msg.append_pair(54, str(side))  # Side
+        msg.append_pair(54, side)  # Side
         msg.append_pair(44, f"{price_val:.8f}")  # Price, formatted to 8 decimals
         msg.append_pair(38, str(qty_val))  # OrderQty
         msg.append_utc_timestamp(52)  # SendingTime
         msg.append_pair(6007, source)  # Custom tag for source
 
-        self._log_fix_message(msg, incoming=False)  # Log outgoing message
+        # Encode once and log those bytes; each encode re-runs the checksum loop
+        raw_msg = msg.encode()
+        self._log_fix_message(raw_msg, incoming=False)  # Log outgoing message
         self.seq_num += 1  # Increment sequence number
-        return msg.encode()
+        return raw_msg
 
     def parse(self, raw_msg):
         """
@@ -140,8 +158,10 @@ class FixEngine:
             self.parser.append_buffer(raw_msg)
             msg = self.parser.get_message()
             if msg:
-                self._log_fix_message(msg, incoming=True)  # Log incoming message
-                seq_num = msg.get(34)
+                # Log the bytes as received rather than re-encoding the parsed message,
+                # which would rebuild every field and recompute the checksum
+                self._log_fix_message(raw_msg, incoming=True)
+                seq_num = msg.get(TAG_MSG_SEQ_NUM)
                 if seq_num:
                     # Update sequence number to next expected value
                     self.seq_num = int(seq_num.decode()) + 1
@@ -158,13 +178,15 @@ class FixEngine:
         Log heartbeat messages to both FIXServer and strategy logger if available.
 
         Args:
-            msg (simplefix.FixMessage): The heartbeat message.
+            msg (simplefix.FixMessage or bytes): The heartbeat message, or its encoding.
             incoming (bool): True if received, False if sent.
         """
         direction = "HEARTBEAT RECEIVED" if incoming else "HEARTBEAT SENT"
         try:
             # Convert FIX message to readable string (replace SOH with '|')
-            raw = msg.encode().decode(errors="replace").replace("\x01", "|")
+            if not isinstance(msg, bytes):
+                msg = msg.encode()
+            raw = msg.decode(errors="replace").replace("\x01", "|")
             self.server_logger.info(f"{direction}: {raw}")
             if self.strategy_logger:
                 self.strategy_logger.info(f"{direction}: {raw}")
@@ -187,10 +209,11 @@ class FixEngine:
         direction = "IN" if incoming else "OUT"
         try:
             # Prepare readable string for logging
-            if isinstance(msg, simplefix.FixMessage):
-                raw = msg.encode().decode(errors="replace").replace("\x01", "|")
-            elif isinstance(msg, bytes):
+            # Bytes first: every engine call site now logs the encoded message
+            if isinstance(msg, bytes):
                 raw = msg.decode(errors="replace").replace("\x01", "|")
+            elif isinstance(msg, simplefix.FixMessage):
+                raw = msg.encode().decode(errors="replace").replace("\x01", "|")
             else:
                 raw = str(msg)
 
@@ -271,9 +294,8 @@ class FixEngine:
             bytes: Encoded FIX ExecutionReport message.
         """
         msg = simplefix.FixMessage()
-        msg.append_pair(8, "FIX.4.4")  # BeginString
-        msg.append_pair(49, "EXCHANGE")  # SenderCompID
-        msg.append_pair(56, "MY_COMPANY")  # TargetCompID
+        for tag, value in EXCHANGE_HEADER:  # BeginString, SenderCompID, TargetCompID
+            msg.append_pair(tag, value)
         msg.append_pair(34, self.seq_num)  # MsgSeqNum
         msg.append_pair(35, "8")  # MsgType: ExecutionReport
         msg.append_pair(11, cl_ord_id)  # ClOrdID
@@ -301,9 +323,10 @@ class FixEngine:
             msg.append_pair(58, text)  # Tag 58: Free text or rejection reason
         msg.append_utc_timestamp(52)  # SendingTime
 
-        self._log_fix_message(msg, incoming=False)  # Log outgoing execution report
+        raw_msg = msg.encode()
+        self._log_fix_message(raw_msg, incoming=False)  # Log outgoing execution report
         self.seq_num += 1  # Increment sequence number
-        return msg.encode()
+        return raw_msg
 
     def update_heartbeat(self):
         """
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import logging
 import threading
 import time
@@ -6,6 +7,8 @@ import uuid
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from sortedcontainers import SortedDict
+
 # Set up a logger specifically for the matching engine
 logger = logging.getLogger("MatchingEngine")
 logger.propagate = False  # Prevent duplicate log entries from propagation
@@ -99,6 +102,10 @@ class MatchingEngine:
         )  # Mapping of strategy name to strategy instance
         self.trading_state = trading_state  # Shared trading state for analytics and UI
         self.state_lock = state_lock  # Lock for thread-safe state updates
+        # ExecIDs: one random prefix per engine plus a counter, instead of a fresh
+        # uuid4 (an os.urandom call and three objects) for every fill report
+        self._exec_prefix = uuid.uuid4().hex[:12]
+        self._exec_seq = itertools.count(1)
 
     def calculate_pnl(self, trade):
         """
@@ -245,184 +252,225 @@ class MatchingEngine:
             self.logger.error("Circuit breaker triggered: halting trading")
             raise TradingHalted("Circuit breaker triggered")
         new_submission_time = time.time_ns()
+        # Read the wall clock once per match; every fill of this order shares it.
+        # order_time is epoch seconds (also used for expiry), so stay on time.time().
+        match_time = new_submission_time / 1e9
+        # Formatted on the first fill only, so passive orders never pay for strftime
+        match_stamp = None
         book = self.order_book.asks if side == "buy" else self.order_book.bids
         trades = []
-        levels = (
-            sorted(book.keys()) if side == "buy" else sorted(book.keys(), reverse=True)
-        )
-        for level_price in levels:
-            if (side == "buy" and level_price > price) or (
-                side == "sell" and level_price < price
-            ):
-                break
-            queue = book[level_price]
-            max_attempts = len(queue)
-            attempts = 0
-            while queue and quantity > 0 and attempts < max_attempts:
-                top_order = queue[0]
-                # Self-Trade Prevention: skip if maker and taker are the same
-                if top_order["source"] == source:
-                    queue.rotate(-1)  # Move this order to the end of the queue
-                    attempts += 1
-                    continue
-                trade_qty = min(quantity, top_order["qty"])
-                order_time = top_order.get("order_time", None)
-                current_time = time.time()
-                latency_ms = (current_time - order_time) * 1000 if order_time else None
-                trade = {
-                    "price": level_price,
-                    "qty": trade_qty,
-                    "maker_id": top_order["id"],
-                    "maker_source": top_order["source"],
-                    "taker_id": order_id,
-                    "taker_source": source,
-                    "side": "sell" if side == "buy" or side == "1" else "buy",
-                    "source": source,
-                    "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "latency_ms": latency_ms,
-                }
-                pnl = self.calculate_pnl(trade)
-                trade["pnl"] = pnl
-                self.circuit_breaker.record_trade(pnl)
-                trades.append(trade)
-                maker_strategy = self.strategies.get(trade["maker_source"])
-                taker_strategy = self.strategies.get(trade["taker_source"])
-
-                symbol = self.order_book.symbol
-
-                if maker_strategy and hasattr(maker_strategy, "logger"):
-                    maker_strategy.logger.info(
-                        f"WIN: {maker_strategy.source_name} filled as maker at {level_price} for {trade_qty} on {symbol} against {source}"
-                    )
-                if taker_strategy and hasattr(taker_strategy, "logger"):
-                    taker_strategy.logger.info(
-                        f"LOSS: {taker_strategy.source_name} lost maker priority at {level_price} for {trade_qty} on {symbol} to {top_order['source']}"
-                    )
-
-                if maker_strategy:
-                    exec_id = str(uuid.uuid4())
-                    fix_engine = maker_strategy.fix_engine
-
-                    # Get original order quantity
-                    original_qty = top_order.get(
-                        "original_qty", top_order["qty"] + trade_qty
-                    )
-                    leaves_qty = top_order["qty"] - trade_qty
-                    if leaves_qty < 0:
-                        leaves_qty = 0
-                    cum_qty = original_qty - leaves_qty
-
-                    # Determine partial/full fill status
-                    if leaves_qty > 0:
-                        ord_status = "1"  # Partially Filled
-                        exec_type = "1"  # Partial Fill
-                    else:
-                        ord_status = "2"  # Filled
-                        exec_type = "F"  # Fil
-
-                    self.create_execution_report(
-                        fix_engine=fix_engine,
-                        cl_ord_id=top_order["id"],
-                        order_id=top_order["id"],
-                        exec_id=exec_id,
-                        ord_status=ord_status,
-                        exec_type=exec_type,
-                        symbol=self.order_book.symbol,
-                        side="1" if trade["side"] == "buy" else "2",
-                        order_qty=original_qty,
-                        last_qty=trade_qty,
-                        last_px=level_price,
-                        leaves_qty=leaves_qty,
-                        cum_qty=cum_qty,
-                        price=level_price,
-                        source=trade["maker_source"],
-                        strategy_name=maker_strategy.source_name,
-                    )
-                    if hasattr(maker_strategy, "on_execution_report"):
-                        maker_strategy.on_execution_report(trade)
-                    if hasattr(maker_strategy, "on_trade"):
-                        maker_strategy.on_trade(trade)
-
-                if taker_strategy:
-                    exec_id = str(uuid.uuid4())
-                    fix_engine = taker_strategy.fix_engine
-
-                    # For the taker, original_qty is the total quantity they submitted (track this if needed)
-                    leaves_qty = quantity - trade_qty
-                    if leaves_qty < 0:
-                        leaves_qty = 0
-                    cum_qty = (quantity + trade_qty) - leaves_qty
-
-                    ord_status = "1" if leaves_qty > 0 else "2"
-                    exec_type = "1" if leaves_qty > 0 else "F"
-
-                    self.create_execution_report(
-                        fix_engine=fix_engine,
-                        cl_ord_id=order_id,
-                        order_id=order_id,
-                        exec_id=exec_id,
-                        ord_status=ord_status,
-                        exec_type=exec_type,
-                        symbol=self.order_book.symbol,
-                        side="1" if trade["side"] == "buy" else "2",
-                        order_qty=quantity + trade_qty,
-                        last_qty=trade_qty,
-                        last_px=level_price,
-                        leaves_qty=leaves_qty,
-                        cum_qty=cum_qty,
-                        price=level_price,
-                        source=trade["taker_source"],
-                        strategy_name=taker_strategy.source_name,
+        if isinstance(book, SortedDict):
+            # OrderBook sides already iterate best-first (bids keyed by negated price),
+            # so copy the keys instead of re-sorting them. A copy, because a resting
+            # remainder may be added to this same side mid-loop.
+            if side in ("buy", "sell"):
+                # Only the crossable prefix: bisect_right applies the side's key
+                # function, so for either side it counts levels at or better than price
+                levels = book.keys()[: book.bisect_right(price)]
+            else:
+                levels = list(book.keys())
+        else:
+            levels = (
+                sorted(book.keys())
+                if side == "buy"
+                else sorted(book.keys(), reverse=True)
+            )
+        # Per-order invariants, hoisted out of the per-fill loop below
+        maker_side = "sell" if side == "buy" or side == "1" else "buy"
+        report_side = "1" if maker_side == "buy" else "2"  # FIX Side for both reports
+        symbol = self.order_book.symbol
+        get_strategy = self.strategies.get
+        taker_strategy = get_strategy(source)
+        levels_drained = False
+        queue = None
+        try:
+            for level_price in levels:
+                if (side == "buy" and level_price > price) or (
+                    side == "sell" and level_price < price
+                ):
+                    break
+                queue = book[level_price]
+                max_attempts = len(queue)
+                attempts = 0
+                while queue and quantity > 0 and attempts < max_attempts:
+                    top_order = queue[0]
+                    # Self-Trade Prevention: skip if maker and taker are the same
+                    if top_order["source"] == source:
+                        queue.rotate(-1)  # Move this order to the end of the queue
+                        attempts += 1
+                        continue
+                    trade_qty = min(quantity, top_order["qty"])
+                    if match_stamp is None:
+                        match_stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    order_time = top_order.get("order_time", None)
+                    latency_ms = (
+                        (match_time - order_time) * 1000 if order_time else None
                     )
-                    if hasattr(taker_strategy, "on_execution_report"):
-                        taker_strategy.on_execution_report(trade)
-                    if hasattr(taker_strategy, "on_trade"):
-                        # Update taker inventory: taker is the buyer if maker's side is "sell"
-                        if trade["side"] == "sell":
-                            taker_strategy.inventory += trade["qty"]
+                    trade = {
+                        "price": level_price,
+                        "qty": trade_qty,
+                        "maker_id": top_order["id"],
+                        "maker_source": top_order["source"],
+                        "taker_id": order_id,
+                        "taker_source": source,
+                        "side": maker_side,
+                        "source": source,
+                        "time": match_stamp,
+                        "latency_ms": latency_ms,
+                    }
+                    pnl = self.calculate_pnl(trade)
+                    trade["pnl"] = pnl
+                    self.circuit_breaker.record_trade(pnl)
+                    trades.append(trade)
+                    maker_strategy = get_strategy(top_order["source"])
+
+                    if maker_strategy and hasattr(maker_strategy, "logger"):
+                        maker_strategy.logger.info(
+                            f"WIN: {maker_strategy.source_name} filled as maker at {level_price} for {trade_qty} on {symbol} against {source}"
+                        )
+                    if taker_strategy and hasattr(taker_strategy, "logger"):
+                        taker_strategy.logger.info(
+                            f"LOSS: {taker_strategy.source_name} lost maker priority at {level_price} for {trade_qty} on {symbol} to {top_order['source']}"
+                        )
+
+                    if maker_strategy:
+                        exec_id = f"{self._exec_prefix}-{next(self._exec_seq)}"
+                        fix_engine = maker_strategy.fix_engine
+
+                        # Get original order quantity
+                        original_qty = top_order.get(
+                            "original_qty", top_order["qty"] + trade_qty
+                        )
+                        leaves_qty = top_order["qty"] - trade_qty
+                        if leaves_qty < 0:
+                            leaves_qty = 0
+                        cum_qty = original_qty - leaves_qty
+
+                        # Determine partial/full fill status
+                        if leaves_qty > 0:
+                            ord_status = "1"  # Partially Filled
+                            exec_type = "1"  # Partial Fill
                         else:
-                            taker_strategy.inventory -= trade["qty"]
-                        taker_strategy.on_trade(trade)
-
-                if self.trading_state is not None and self.state_lock is not None:
-                    symbol = self.order_book.symbol
-                    if latency_ms is not None:
+                            ord_status = "2"  # Filled
+                            exec_type = "F"  # Fil
+
+                        self.create_execution_report(
+                            fix_engine=fix_engine,
+                            cl_ord_id=top_order["id"],
+                            order_id=top_order["id"],
+                            exec_id=exec_id,
+                            ord_status=ord_status,
+                            exec_type=exec_type,
+                            symbol=symbol,
+                            side=report_side,
+                            order_qty=original_qty,
+                            last_qty=trade_qty,
+                            last_px=level_price,
+                            leaves_qty=leaves_qty,
+                            cum_qty=cum_qty,
+                            price=level_price,
+                            source=trade["maker_source"],
+                            strategy_name=maker_strategy.source_name,
+                        )
+                        if hasattr(maker_strategy, "on_execution_report"):
+                            maker_strategy.on_execution_report(trade)
+                        if hasattr(maker_strategy, "on_trade"):
+                            maker_strategy.on_trade(trade)
+
+                    if taker_strategy:
+                        exec_id = f"{self._exec_prefix}-{next(self._exec_seq)}"
+                        fix_engine = taker_strategy.fix_engine
+
+                        # For the taker, original_qty is the total quantity they submitted (track this if needed)
+                        leaves_qty = quantity - trade_qty
+                        if leaves_qty < 0:
+                            leaves_qty = 0
+                        cum_qty = (quantity + trade_qty) - leaves_qty
+
+                        ord_status = "1" if leaves_qty > 0 else "2"
+                        exec_type = "1" if leaves_qty > 0 else "F"
+
+                        self.create_execution_report(
+                            fix_engine=fix_engine,
+                            cl_ord_id=order_id,
+                            order_id=order_id,
+                            exec_id=exec_id,
+                            ord_status=ord_status,
+                            exec_type=exec_type,
+                            symbol=symbol,
+                            side=report_side,
+                            order_qty=quantity + trade_qty,
+                            last_qty=trade_qty,
+                            last_px=level_price,
+                            leaves_qty=leaves_qty,
+                            cum_qty=cum_qty,
+                            price=level_price,
+                            source=trade["taker_source"],
+                            strategy_name=taker_strategy.source_name,
+                        )
+                        if hasattr(taker_strategy, "on_execution_report"):
+                            taker_strategy.on_execution_report(trade)
+                        if hasattr(taker_strategy, "on_trade"):
+                            # Update taker inventory: taker is the buyer if maker's side is "sell"
+                            if trade["side"] == "sell":
+                                taker_strategy.inventory += trade["qty"]
+                            else:
+                                taker_strategy.inventory -= trade["qty"]
+                            taker_strategy.on_trade(trade)
+
+                    if self.trading_state is not None and self.state_lock is not None:
+                        taker_latency = (time.time_ns() - new_submission_time) / 1e6
+                        # One short lock hold per fill covers both samples and the trim,
+                        # so concurrent matchers never touch the shared list unlocked
                         with self.state_lock:
                             latency_list = self.trading_state.setdefault(
                                 "latency_history", {}
                             ).setdefault(symbol, [])
+                            if latency_ms is not None:
+                                latency_list.append(
+                                    {
+                                        "time": trade["time"],
+                                        "latency_ms": latency_ms,
+                                        "strategy": trade["maker_source"],
+                                        "type": "maker",
+                                    }
+                                )
                             latency_list.append(
                                 {
                                     "time": trade["time"],
-                                    "latency_ms": latency_ms,
-                                    "strategy": trade["maker_source"],
-                                    "type": "maker",
+                                    "latency_ms": taker_latency,
+                                    "strategy": trade["taker_source"],
+                                    "type": "taker",
                                 }
                             )
-
-                    taker_latency = (time.time_ns() - new_submission_time) / 1e6
-                    latency_list.append(
-                        {
-                            "time": trade["time"],
-                            "latency_ms": taker_latency,
-                            "strategy": trade["taker_source"],
-                            "type": "taker",
-                        }
-                    )
-                    if len(latency_list) > 500:
-                        self.trading_state["latency_history"][symbol] = latency_list[
-                            -500:
-                        ]
-
-                quantity -= trade_qty
-                top_order["qty"] -= trade_qty
-                if top_order["qty"] == 0:
-                    queue.popleft()
-
-                if quantity > 0:
-                    self.order_book.add_order(side, price, quantity, order_id, source)
-
-            # After max_attempts, break to avoid infinite loop if all orders at this level are from self
+                            if len(latency_list) > 500:
+                                del latency_list[:-500]
+
+                    quantity -= trade_qty
+                    top_order["qty"] -= trade_qty
+                    if top_order["qty"] == 0:
+                        queue.popleft()
+
+                    if quantity > 0:
+                        self.order_book.add_order(
+                            side, price, quantity, order_id, source
+                        )
+
+                if not queue:
+                    # Drop the drained level so best bid/ask never lands on an empty one
+                    del book[level_price]
+                    levels_drained = True
+
+                # After max_attempts, break to avoid infinite loop if all orders at this level are from self
+        finally:
+            # A callback or the residual add_order may raise mid-match. Drop the level
+            # being walked if it was already emptied, then republish the top for
+            # every removed level so readers never see a price that is gone.
+            if queue is not None and not queue and book.get(level_price) is queue:
+                del book[level_price]
+                levels_drained = True
+            if levels_drained:
+                self.order_book.refresh_top()
         for trade in trades:
             latency_info = (
                 f" | Latency: {trade['latency_ms']:.2f} ms"
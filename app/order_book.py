@@ -1,8 +1,11 @@
 import time
 from collections import deque
+from itertools import islice
 
 from sortedcontainers import SortedDict
 
+TRADE_HISTORY_LIMIT = 1000  # Most recent trade prices kept per book
+
 
 class OrderBook:
     def __init__(self, symbol):
@@ -16,9 +19,26 @@ class OrderBook:
         self.bids = SortedDict(lambda x: -x)  # Price → deque of orders
         # Asks stored in ascending order by price (lowest ask first)
         self.asks = SortedDict()  # Price → deque of orders
-        self.trade_history = []  # List to store recent trade prices for analytics
+        # Recent trade prices for analytics; bounded so old prices drop off in O(1)
+        self.trade_history = deque(maxlen=TRADE_HISTORY_LIMIT)
         self.last_price = None  # Last traded price
         self.order_map = {}  # Track all orders by order_id
+        # Published top-of-book prices (best_bid, best_ask). Single writer replaces the
+        # tuple in slot 0; readers take it without a lock (slot assignment is atomic).
+        self._top = [(None, None)]
+
+    def reset(self):
+        """
+        Empty the book in place: both sides, the order map, trade history and the
+        published top. The containers are cleared rather than rebuilt, so references
+        already held to them (e.g. by a MatchingEngine) stay valid.
+        """
+        self.bids.clear()
+        self.asks.clear()
+        self.trade_history.clear()
+        self.order_map.clear()
+        self.last_price = None
+        self._top[0] = (None, None)
 
     def add_order(self, side, price, quantity, order_id, source, order_time=None):
         """
@@ -53,9 +73,10 @@ class OrderBook:
         # Select the appropriate book side (bids or asks)
         book = self.bids if side == "buy" else self.asks
 
-        # Create a new price level if it does not exist
-        if price not in book:
-            book[price] = deque()  # Use deque for efficient FIFO queue of orders
+        # Create a new price level if it does not exist (one lookup on the hit path)
+        queue = book.get(price)
+        if queue is None:
+            queue = book[price] = deque()  # deque: efficient FIFO queue of orders
 
         # Create order record
         order = {
@@ -69,8 +90,62 @@ class OrderBook:
         }
 
         # Append the order to the queue for this price level
-        book[price].append(order)
+        queue.append(order)
         self.order_map[order_id] = (price, side)
+        # Adding never removes a level, so the top only moves if this price improves
+        # on it: one comparison against the published tuple instead of refresh_top()
+        best_bid, best_ask = self._top[0]
+        if side == "buy":
+            if best_bid is None or price > best_bid:
+                self._top[0] = (price, best_ask)
+        elif best_ask is None or price < best_ask:
+            self._top[0] = (best_bid, price)
+
+    def _seed_bulk(self, orders):
+        """
+        Append pre-validated orders without add_order's per-order checks.
+        For internal seeding and tests only: sides must already be '1'/'2' and
+        price/quantity already numeric. The top-of-book is republished once at the end.
+        Args:
+            orders (iterable): (side, price, quantity, order_id, source) tuples.
+        """
+        now = time.time()
+        for side, price, quantity, order_id, source in orders:
+            side = "buy" if side == "1" else "sell"
+            book = self.bids if side == "buy" else self.asks
+            queue = book.get(price)
+            if queue is None:
+                queue = book[price] = deque()
+            queue.append(
+                {
+                    "id": order_id,
+                    "qty": quantity,
+                    "original_qty": quantity,
+                    "source": source,
+                    "order_time": now,
+                    "price": price,
+                    "side": side,
+                }
+            )
+            self.order_map[order_id] = (price, side)
+        self.refresh_top()
+
+    def refresh_top(self):
+        """
+        Republish the top-of-book snapshot after price levels are added or removed.
+        Call this after mutating bids/asks directly (outside the OrderBook methods).
+        """
+        best_bid = self.bids.keys()[0] if self.bids else None
+        best_ask = self.asks.keys()[0] if self.asks else None
+        self._top[0] = (best_bid, best_ask)
+
+    def top(self):
+        """
+        Get the best bid and ask prices from the published snapshot, without walking the book.
+        Returns:
+            tuple: (best_bid_price, best_ask_price); either may be None if that side is empty.
+        """
+        return self._top[0]
 
     def get_depth_snapshot(self, levels=10):
         """
@@ -99,10 +174,8 @@ class OrderBook:
         cumulative = 0
         result = []
 
-        prices = list(book.keys())[:levels]
-        # REMOVE the prices[::-1] reversal!
-        for price in prices:
-            orders = list(book[price])
+        # Slice the sorted view directly: O(levels) instead of copying every key
+        for price, orders in book.items()[:levels]:
             total_qty = sum(order["qty"] for order in orders)
             cumulative += total_qty
             result.append(
@@ -121,7 +194,7 @@ class OrderBook:
         Returns:
             dict or None: Dict with 'price' and 'qty' keys or None if no bids.
         """
-        return self._get_best_level(self.bids, max)
+        return self._get_best_level(self.bids)
 
     def get_best_ask(self):
         """
@@ -129,23 +202,24 @@ class OrderBook:
         Returns:
             dict or None: Dict with 'price' and 'qty' keys or None if no asks.
         """
-        return self._get_best_level(self.asks, min)
+        return self._get_best_level(self.asks)
 
-    def _get_best_level(self, book, extremum_func):
+    def _get_best_level(self, book):
         """
-        Generic helper to get best price level using min or max function.
+        Generic helper to get the best price level of one side of the book.
+        Both sides sort best-first (bids by negated price), so the best level is
+        always the first item: O(1) instead of scanning every key.
         Args:
             book (SortedDict): Bids or asks book.
-            extremum_func (function): min or max function.
         Returns:
             dict or None: Dict with price and qty or None if empty.
         """
         if not book:
             return None
-        best_price = extremum_func(book.keys())
+        best_price, orders = book.peekitem(0)
         return {
             "price": best_price,
-            "qty": sum(order["qty"] for order in book[best_price]),
+            "qty": sum(order["qty"] for order in orders),
         }
 
     def record_trade(self, price):
@@ -154,10 +228,8 @@ class OrderBook:
         Args:
             price (float): Price at which trade occurred.
         """
+        # The deque's maxlen discards the oldest price once the limit is reached
         self.trade_history.append(price)
-        # Keep trade history size manageable (e.g., last 1000 trades)
-        if len(self.trade_history) > 1000:
-            self.trade_history.pop(0)
 
     def get_recent_prices(self, window=30):
         """
@@ -167,9 +239,10 @@ class OrderBook:
         Returns:
             list: List of recent trade prices.
         """
-        if not self.trade_history:
-            return []
-        return self.trade_history[-window:]
+        # deques do not slice; walk back `window` entries from the newest instead
+        recent = list(islice(reversed(self.trade_history), window))
+        recent.reverse()
+        return recent
 
     def seed_synthetic_depth(self, mid_price, levels=10, base_qty=100):
         """
@@ -186,16 +259,22 @@ class OrderBook:
             print(f"WARNING: No market data for {self.symbol}, using fallback price 100.0")
             mid_price = 100.0
 
+        mid_price = float(mid_price)
         # Optionally, always seed the top-of-book as well for robustness
-        self.add_order("1", mid_price * (1 - 0.005 * 1), int(base_qty), "SEED-BID-1", "system")
-        self.add_order("2", mid_price * (1 + 0.005 * 1), int(base_qty), "SEED-ASK-1", "system")
+        seed = [
+            ("1", mid_price * (1 - 0.005 * 1), int(base_qty), "SEED-BID-1", "system"),
+            ("2", mid_price * (1 + 0.005 * 1), int(base_qty), "SEED-ASK-1", "system"),
+        ]
 
         for i in range(2, levels + 2):  # start at i=2 for wider spread
             bid_price = mid_price * (1 - 0.005 * i)
             ask_price = mid_price * (1 + 0.005 * i)
             qty = int(base_qty * (0.8 ** i))
-            self.add_order("1", bid_price, qty, f"SEED-BID-{i}", "system")
-            self.add_order("2", ask_price, qty, f"SEED-ASK-{i}", "system")
+            seed.append(("1", bid_price, qty, f"SEED-BID-{i}", "system"))
+            seed.append(("2", ask_price, qty, f"SEED-ASK-{i}", "system"))
+
+        # Generated orders are valid by construction; skip add_order's checks
+        self._seed_bulk(seed)
 
     def get_mid_price(self):
         """
@@ -203,11 +282,10 @@ class OrderBook:
         Returns:
             float or None: Mid-price or None if bids or asks are empty.
         """
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
+        best_bid, best_ask = self.top()
         if best_bid is None or best_ask is None:
             return None
-        return (best_bid["price"] + best_ask["price"]) / 2
+        return (best_bid + best_ask) / 2
 
     def expire_old_orders(self, max_age=60):
         """
@@ -228,6 +306,7 @@ class OrderBook:
                 # Remove price level if empty after expiry
                 if not queue:
                     del book[price]
+        self.refresh_top()
 
     def remove_order(self, order_id):
         """
@@ -247,22 +326,24 @@ class OrderBook:
             del self.order_map[order_id]
             return None
 
-        # Find and remove the order
-        new_queue = deque()
-        removed_order = None
-        for order in book[price]:
+        # order_map already locates the level; delete in place rather than rebuilding
+        # the deque, so the remaining orders keep their FIFO positions and identity
+        queue = book[price]
+        for index, order in enumerate(queue):
             if order["id"] == order_id:
-                removed_order = order
-            else:
-                new_queue.append(order)
-
-        if removed_order:
-            book[price] = new_queue
-            if not book[price]:
-                del book[price]
+                break
+        else:
+            # Filled by the matching engine since it was mapped; drop the stale entry
             del self.order_map[order_id]
+            return None
+
+        del queue[index]
+        if not queue:
+            del book[price]
+            self.refresh_top()
+        del self.order_map[order_id]
 
-        return removed_order
+        return order
 
     def get_order_source(self, order_id):
         """
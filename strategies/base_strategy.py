@@ -1,10 +1,24 @@
 import logging
 import time
 from abc import ABC
+from itertools import islice
+from typing import NamedTuple
 
 import numpy as np  # Required for volatility calculations
 
 
+class OrderTuple(NamedTuple):
+    """
+    Immutable order instruction returned by generate_orders().
+    Use _asdict() where a dict is needed (e.g. JSON serialisation).
+    """
+
+    side: str  # '1' (buy) or '2' (sell) per FIX standard
+    price: float
+    quantity: int
+    order_id: str | None = None  # Optional reference to the book order being hit
+
+
 class BaseStrategy(ABC):
     """
     Abstract base class for trading strategies.
@@ -67,6 +81,12 @@ class BaseStrategy(ABC):
         self.total_trades = 0
         self.winning_trades = 0
 
+        # Short-lived cache for adaptive order size: (timestamp, key, size)
+        self.adaptive_size_ttl = self.params.get(
+            "adaptive_size_ttl", 0.1
+        )  # Seconds a computed size stays valid
+        self._aos_cache = (0.0, None, None)
+
         # Logger for this strategy instance
         self.logger = logging.getLogger(f"FIX_{self.source_name}")
 
@@ -230,8 +250,8 @@ class BaseStrategy(ABC):
         """
         book = self.order_book.bids if side == "2" else self.order_book.asks
         total_liquidity = 0
-        levels = list(book.values())[:5]
-        for orders_at_level in levels:
+        # Take the first five levels lazily rather than copying every level first
+        for orders_at_level in islice(book.values(), 5):
             total_liquidity += sum(order["qty"] for order in orders_at_level)
         # Allow max 20% of liquidity to be taken
         return quantity <= total_liquidity * 0.2 if total_liquidity > 0 else False
@@ -409,11 +429,21 @@ class BaseStrategy(ABC):
         Returns:
             int: Adaptive order size.
         """
-        vol = self._current_volatility(window=volatility_window)
+        # Reuse the last result if it was computed for the same inputs very recently.
+        # Key on the resolved cap so a change to max_order_qty is picked up at once.
+        now = time.monotonic()
         max_qty = max_size if max_size is not None else self.max_order_qty
+        key = (min_size, max_qty, volatility_window)
+        cached_at, cached_key, cached_size = self._aos_cache
+        if cached_key == key and now - cached_at < self.adaptive_size_ttl:
+            return cached_size
+
+        vol = self._current_volatility(window=volatility_window)
         # Avoid division by zero and cap size
         adaptive_size = max(min_size, int(max_qty / (vol + 0.01)))
-        return min(adaptive_size, max_qty)
+        size = min(adaptive_size, max_qty)
+        self._aos_cache = (now, key, size)
+        return size
 
     def update_unrealised_pnl_and_drawdown(self):
         """
@@ -1,7 +1,7 @@
 import random
 import time
 
-from .base_strategy import BaseStrategy
+from .base_strategy import BaseStrategy, OrderTuple
 
 
 class PassiveLiquidityProvider(BaseStrategy):
@@ -81,15 +81,11 @@ class PassiveLiquidityProvider(BaseStrategy):
             if self.inventory > 0:
                 if best_ask:
                     self.place_order("2", best_ask["price"], qty)
-                    orders.append(
-                        {"side": "2", "price": best_ask["price"], "quantity": qty}
-                    )
+                    orders.append(OrderTuple("2", best_ask["price"], qty))
             elif self.inventory < 0:
                 if best_bid:
                     self.place_order("1", best_bid["price"], qty)
-                    orders.append(
-                        {"side": "1", "price": best_bid["price"], "quantity": qty}
-                    )
+                    orders.append(OrderTuple("1", best_bid["price"], qty))
             if self.inventory == 0:
                 self.rebalance_pending = False
             return orders
@@ -109,13 +105,7 @@ class PassiveLiquidityProvider(BaseStrategy):
             )
             if self.inventory + quantity <= self.max_inventory:
                 self.place_order("1", best_bid["price"], quantity)
-                orders.append(
-                    {
-                        "side": "1",
-                        "price": best_bid["price"],
-                        "quantity": quantity,
-                    }
-                )
+                orders.append(OrderTuple("1", best_bid["price"], quantity))
 
         # Generate sell order
         if best_ask:
@@ -124,9 +114,7 @@ class PassiveLiquidityProvider(BaseStrategy):
             )
             if self.inventory - quantity >= -self.max_inventory:
                 self.place_order("2", best_ask["price"], quantity)
-                orders.append(
-                    {"side": "2", "price": best_ask["price"], "quantity": quantity}
-                )
+                orders.append(OrderTuple("2", best_ask["price"], quantity))
 
         self.last_order_time = now
         return orders
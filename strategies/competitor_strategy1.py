@@ -1,7 +1,7 @@
 import random
 import time
 
-from .base_strategy import BaseStrategy
+from .base_strategy import BaseStrategy, OrderTuple
 
 
 class MarketMakerStrategy(BaseStrategy):
@@ -81,16 +81,12 @@ class MarketMakerStrategy(BaseStrategy):
                 best_ask = self.order_book.get_best_ask()
                 if best_ask:
                     self.place_order("2", best_ask["price"], qty)
-                    orders.append(
-                        {"side": "2", "price": best_ask["price"], "quantity": qty}
-                    )
+                    orders.append(OrderTuple("2", best_ask["price"], qty))
             elif self.inventory < 0:
                 best_bid = self.order_book.get_best_bid()
                 if best_bid:
                     self.place_order("1", best_bid["price"], qty)
-                    orders.append(
-                        {"side": "1", "price": best_bid["price"], "quantity": qty}
-                    )
+                    orders.append(OrderTuple("1", best_bid["price"], qty))
             # **Add this block to reset rebalance_pending if inventory is zero**
             if self.inventory == 0:
                 self.rebalance_pending = False
@@ -116,7 +112,7 @@ class MarketMakerStrategy(BaseStrategy):
             1, self.get_adaptive_order_size(min_size=1, max_size=10)
         )
         if self.inventory + buy_qty <= self.max_inventory:
-            orders.append({"side": "1", "price": bid_price, "quantity": buy_qty})
+            orders.append(OrderTuple("1", bid_price, buy_qty))
             self.place_order("1", bid_price, buy_qty)
             self.logger.info(
                 f"{self.source_name}: Placed BUY order {buy_qty}@{bid_price:.4f}"
@@ -128,7 +124,7 @@ class MarketMakerStrategy(BaseStrategy):
             1, self.get_adaptive_order_size(min_size=1, max_size=10)
         )
         if self.inventory - sell_qty >= -self.max_inventory:
-            orders.append({"side": "2", "price": ask_price, "quantity": sell_qty})
+            orders.append(OrderTuple("2", ask_price, sell_qty))
             self.place_order("2", ask_price, sell_qty)
             self.logger.info(
                 f"{self.source_name}: Placed SELL order {sell_qty}@{ask_price:.4f}"
@@ -2,7 +2,7 @@ import time
 
 import numpy as np
 
-from .base_strategy import BaseStrategy
+from .base_strategy import BaseStrategy, OrderTuple
 
 
 class MomentumStrategy(BaseStrategy):
@@ -86,24 +86,14 @@ class MomentumStrategy(BaseStrategy):
                 if best_ask:
                     self.place_order("2", best_ask["price"], qty)
                     orders.append(
-                        {
-                            "side": "2",
-                            "price": best_ask["price"],
-                            "quantity": qty,
-                            "order_id": best_ask["order_id"],
-                        }
+                        OrderTuple("2", best_ask["price"], qty, best_ask["order_id"])
                     )
             elif self.inventory < 0:
                 best_bid = self.order_book.get_best_bid()
                 if best_bid:
                     self.place_order("1", best_bid["price"], qty)
                     orders.append(
-                        {
-                            "side": "1",
-                            "price": best_bid["price"],
-                            "quantity": qty,
-                            "order_id": best_bid["order_id"],
-                        }
+                        OrderTuple("1", best_bid["price"], qty, best_bid["order_id"])
                     )
             # **Add this block to reset rebalance_pending if inventory is zero**
             if self.inventory == 0:
@@ -135,7 +125,7 @@ class MomentumStrategy(BaseStrategy):
         sell_qty = base_size + self.size_skew if trend < 0 else base_size
 
         if self.inventory + buy_qty <= self.max_inventory:
-            orders.append({"side": "1", "price": bid_price, "quantity": buy_qty})
+            orders.append(OrderTuple("1", bid_price, buy_qty))
             self.place_order("1", bid_price, buy_qty)
             self.logger.info(
                 f"{self.source_name}: Placed BID {buy_qty}@{bid_price:.4f} (trend={trend:.4f})"
@@ -143,7 +133,7 @@ class MomentumStrategy(BaseStrategy):
             # Do NOT update inventory here
 
         if self.inventory - sell_qty >= -self.max_inventory:
-            orders.append({"side": "2", "price": ask_price, "quantity": sell_qty})
+            orders.append(OrderTuple("2", ask_price, sell_qty))
             self.place_order("2", ask_price, sell_qty)
             self.logger.info(
                 f"{self.source_name}: Placed ASK {sell_qty}@{ask_price:.4f} (trend={trend:.4f})"
@@ -1,7 +1,7 @@
 import random
 import time
 
-from .base_strategy import BaseStrategy
+from .base_strategy import BaseStrategy, OrderTuple
 
 
 class MyStrategy(BaseStrategy):
@@ -16,23 +16,30 @@ class MyStrategy(BaseStrategy):
         self.spread_factor = self.params.get("spread_factor", 0.01)
         self.max_inventory = 100
         self.rebalance_pending = False  # Flag for rebalancing
+        self._side_sign = {"1": 1, "2": -1}  # FIX side -> inventory direction
+
+    def _within_inventory_limit(self, side, quantity):
+        """
+        Check the post-fill inventory against the limit on the side the order moves it.
+        Buys are bounded by +max_inventory and sells by -max_inventory; unknown sides pass.
+        """
+        sign = self._side_sign.get(side, 0)
+        return sign * (self.inventory + sign * quantity) <= self.max_inventory
 
     def _risk_check(self, side, price, quantity):
         """
         Risk check override to prevent overexposure and large orders.
         """
-        if side == "1":  # Buy order
-            if self.inventory + quantity > self.max_inventory:
+        if not self._within_inventory_limit(side, quantity):
+            if side == "1":
                 self.logger.warning(
                     f"{self.source_name}: Buy order rejected (would exceed max inventory)."
                 )
-                return False
-        elif side == "2":  # Sell order
-            if self.inventory - quantity < -self.max_inventory:
+            else:
                 self.logger.warning(
                     f"{self.source_name}: Sell order rejected (would exceed short max inventory)."
                 )
-                return False
+            return False
         if quantity > 500:
             self.logger.warning(f"{self.source_name}: Order rejected (quantity > 500).")
             return False
@@ -67,16 +74,12 @@ class MyStrategy(BaseStrategy):
                 best_ask = self.order_book.get_best_ask()
                 if best_ask:
                     self.place_order("2", best_ask["price"], qty)
-                    orders.append(
-                        {"side": "2", "price": best_ask["price"], "quantity": qty}
-                    )
+                    orders.append(OrderTuple("2", best_ask["price"], qty))
             elif self.inventory < 0:
                 best_bid = self.order_book.get_best_bid()
                 if best_bid:
                     self.place_order("1", best_bid["price"], qty)
-                    orders.append(
-                        {"side": "1", "price": best_bid["price"], "quantity": qty}
-                    )
+                    orders.append(OrderTuple("1", best_bid["price"], qty))
             # **Add this block to reset rebalance_pending if inventory is zero**
             if self.inventory == 0:
                 self.rebalance_pending = False
@@ -92,30 +95,31 @@ class MyStrategy(BaseStrategy):
             return orders
 
         if best_bid and best_ask:
+            # Volatility does not move between the buy and sell legs; size once per tick
+            max_qty = self.get_adaptive_order_size(min_size=1, max_size=10)
+            buy_qty = random.randint(1, max_qty)
+            sell_qty = random.randint(1, max_qty)
+
             adjusted_bid = best_bid["price"] * (1 - self.spread_factor)
             adjusted_ask = best_ask["price"] * (1 + self.spread_factor)
 
-            buy_qty = random.randint(
-                1, self.get_adaptive_order_size(min_size=1, max_size=10)
-            )
-            if self.inventory + buy_qty <= self.max_inventory:
-                orders.append({"side": "1", "price": adjusted_bid, "quantity": buy_qty})
-                self.place_order("1", adjusted_bid, buy_qty)
-                self.logger.info(
-                    f"{self.source_name}: Placed BUY order {buy_qty}@{adjusted_bid:.4f}"
-                )
-
-            sell_qty = random.randint(
-                1, self.get_adaptive_order_size(min_size=1, max_size=10)
-            )
-            if self.inventory - sell_qty >= -self.max_inventory:
-                orders.append(
-                    {"side": "2", "price": adjusted_ask, "quantity": sell_qty}
+            # Keep the legs within the inventory limit (the same check _risk_check
+            # applies), then emit them in one go
+            accepted = [
+                order
+                for order in (
+                    OrderTuple("1", adjusted_bid, buy_qty),
+                    OrderTuple("2", adjusted_ask, sell_qty),
                 )
-                self.place_order("2", adjusted_ask, sell_qty)
+                if self._within_inventory_limit(order.side, order.quantity)
+            ]
+            for order in accepted:
+                self.place_order(order.side, order.price, order.quantity)
                 self.logger.info(
-                    f"{self.source_name}: Placed SELL order {sell_qty}@{adjusted_ask:.4f}"
+                    f"{self.source_name}: Placed {'BUY' if order.side == '1' else 'SELL'} "
+                    f"order {order.quantity}@{order.price:.4f}"
                 )
+            orders.extend(accepted)
 
         self.last_order_time = now
         return orders
@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pin_test_cpu():
+    """
+    Pin the test process to a single CPU so latency measurements are not skewed
+    by cross-core migrations. The core is taken from TEST_CPU (default 3).
+    No-op on platforms without sched_setaffinity or when that core is unavailable.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    original = os.sched_getaffinity(0)
+    cpu = int(os.environ.get("TEST_CPU", "3"))
+    if cpu not in original:
+        yield
+        return
+    os.sched_setaffinity(0, {cpu})
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, original)
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+
+def poll_until(fn, timeout=10, initial=0.05, factor=2.0):
+    """
+    Call fn with exponential backoff until it returns a truthy value or timeout expires.
+    Args:
+        fn (callable): Zero-argument callable polled for a result.
+        timeout (float): Maximum time to keep polling, in seconds.
+        initial (float): First delay between attempts, in seconds.
+        factor (float): Multiplier applied to the delay after each attempt.
+    Returns:
+        The first truthy result from fn, or the last (falsy) result on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        result = fn()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return result
+        time.sleep(min(delay, remaining))
+        delay *= factor
+
+
+async def async_poll_until(fn, timeout=10, initial=0.05, factor=2.0):
+    """
+    Async counterpart of poll_until: await fn() with exponential backoff until it
+    returns a truthy value or timeout expires.
+    Args:
+        fn (callable): Zero-argument coroutine function polled for a result.
+        timeout (float): Maximum time to keep polling, in seconds.
+        initial (float): First delay between attempts, in seconds.
+        factor (float): Multiplier applied to the delay after each attempt.
+    Returns:
+        The first truthy result from fn, or the last (falsy) result on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        result = await fn()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return result
+        await asyncio.sleep(min(delay, remaining))
+        delay *= factor
@@ -1,27 +1,43 @@
-import requests
-import time
+import asyncio
+
+import httpx
+import numpy as np
+
+from tests.Integration.polling import async_poll_until
+
+
+def _has_positive_qty(levels):
+    qtys = np.fromiter((level["qty"] for level in levels), dtype=np.float64, count=len(levels))
+    return bool((qtys > 0).any())
+
+
+def _has_liquidity(data):
+    return ("bids" in data and _has_positive_qty(data["bids"])) or \
+           ("asks" in data and _has_positive_qty(data["asks"]))
+
+
+async def _poll_order_books(symbols, last_data):
+    # One keep-alive client; all symbol requests per attempt are in flight together
+    async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
+
+        async def fetch_any_liquidity():
+            responses = await asyncio.gather(
+                *(client.get("/order_book", params={"symbol": s}) for s in symbols)
+            )
+            for symbol, resp in zip(symbols, responses):
+                if resp.status_code == 200:
+                    last_data[symbol] = resp.json()
+            return any(_has_liquidity(data) for data in last_data.values())
+
+        return await async_poll_until(fetch_any_liquidity, timeout=10)  # Try for up to 10 seconds
 
 
 def test_order_book_has_bids_or_asks():
     symbols = ["AD.AS", "ASML.AS", "INGA.AS", "OR.PA", "PHIA.AS", "SAN.PA"]
-    found = False
     last_data = {}
-    for attempt in range(10):  # Try for up to 10 seconds
-        for symbol in symbols:
-            resp = requests.get(f"http://localhost:8000/order_book?symbol={symbol}")
-            if resp.status_code != 200:
-                continue
-            data = resp.json()
-            last_data[symbol] = data
-            if ("bids" in data and any(bid["qty"] > 0 for bid in data["bids"])) or \
-               ("asks" in data and any(ask["qty"] > 0 for ask in data["asks"])):
-                found = True
-                break
-        if found:
-            break
-        time.sleep(1)
-    else:
+    found = asyncio.run(_poll_order_books(symbols, last_data))
+    if not found:
         print("Order book data at test time:")
         for symbol, data in last_data.items():
             print(f"{symbol}: {data}")
-    assert found, "No bids or asks with qty > 0 found for any tested symbol"
\ No newline at end of file
+    assert found, "No bids or asks with qty > 0 found for any tested symbol"
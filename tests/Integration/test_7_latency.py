@@ -4,9 +4,12 @@ import requests
 
 
 def test_order_latency():
-    # Use /toggle_my_strategy as a proxy for latency measurement
-    start = time.time()
-    resp = requests.post("http://localhost:8000/toggle_my_strategy")
+    with requests.Session() as session:
+        # Warm up the connection so the timed request excludes connection setup
+        session.get("http://localhost:8000/status")
+        # Use /toggle_my_strategy as a proxy for latency measurement
+        start = time.perf_counter()
+        resp = session.post("http://localhost:8000/toggle_my_strategy")
+        latency = time.perf_counter() - start
     assert resp.status_code == 200
-    latency = time.time() - start
     assert latency < 2  # Example threshold (adjust as needed)
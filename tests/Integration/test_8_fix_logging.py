@@ -1,17 +1,25 @@
-import time
+from tests.Integration.polling import poll_until
+
+LOG_PATH = "logs/fix_my_strategy.log"
+EXPECTED = b"===== FIX ENGINE INITIALISED FOR SYMBOL my_strategy ====="
 
 
 def test_fix_logging():
-    found = False
-    log_content = ""
-    for _ in range(20):  # Try for up to 20 seconds
-        with open("logs/fix_my_strategy.log") as f:
-            log_content = f.read()
-        if "===== FIX ENGINE INITIALISED FOR SYMBOL my_strategy =====" in log_content:
-            found = True
-            break
-        time.sleep(1)
-    if not found:
-        print("--- Fix log content at failure ---")
-        print(log_content)
-    assert found, "Expected FIX message not found in log"
\ No newline at end of file
+    with open(LOG_PATH, "rb") as f:
+        tail = b""
+
+        def log_has_expected_message():
+            nonlocal tail
+            # Scan only bytes appended since the last poll; the file position is kept
+            # between calls. Carry the end of the previous read so a match split
+            # across two reads is still found.
+            window = tail + f.read()
+            tail = window[-(len(EXPECTED) - 1):]
+            return window.find(EXPECTED) != -1
+
+        found = poll_until(log_has_expected_message, timeout=20)  # Try for up to 20 seconds
+        if not found:
+            print("--- Fix log content at failure ---")
+            f.seek(0)
+            print(f.read().decode("utf-8", errors="replace"))
+    assert found, "Expected FIX message not found in log"
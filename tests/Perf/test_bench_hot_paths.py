@@ -0,0 +1,63 @@
+"""
+Throughput benchmarks for the order book, matching engine and FIX engine hot paths.
+
+These sit alongside the Unit/System suites rather than replacing their asserts and
+need the pytest-benchmark plugin; without it the module is skipped. Run on demand:
+
+    pytest tests/Perf --benchmark-only
+"""
+
+from collections import deque
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.fix_engine import FixEngine  # noqa: E402
+from app.matching_engine import MatchingEngine  # noqa: E402
+from app.order_book import OrderBook  # noqa: E402
+
+
+def _seed_ask_level(book):
+    # One resting ask for the taker to fill completely; reset before every round
+    book.asks.clear()
+    book.asks[101.0] = deque(
+        [{"id": "ask1", "qty": 10, "source": "maker", "order_time": 0}]
+    )
+    return ("buy", 101.0, 10, "taker1", "taker"), {}
+
+
+def test_bench_add_order(benchmark):
+    book = OrderBook("BENCH")
+    benchmark(book.add_order, "1", 100.0, 10, "bid1", "bench")
+
+
+def test_bench_get_depth_snapshot(benchmark):
+    book = OrderBook("BENCH")
+    book.seed_synthetic_depth(mid_price=100.0, levels=20)
+    snapshot = benchmark(book.get_depth_snapshot, 10)
+    assert len(snapshot["bids"]) == 10
+
+
+def test_bench_match_order(benchmark):
+    book = OrderBook("BENCH")
+    engine = MatchingEngine(book)
+    trades = benchmark.pedantic(
+        engine.match_order,
+        setup=lambda: _seed_ask_level(book),
+        rounds=1000,
+    )
+    assert trades[0]["qty"] == 10
+
+
+def test_bench_create_new_order(benchmark):
+    engine = FixEngine(symbol="BENCH")
+    raw = benchmark(engine.create_new_order, "OID1", "BENCH", "1", 100.0, 10, "bench")
+    assert raw.startswith(b"8=FIX")
+
+
+def test_bench_parse(benchmark):
+    engine = FixEngine(symbol="BENCH")
+    raw = engine.create_new_order("OID1", "BENCH", "1", 100.0, 10, "bench")
+    msg = benchmark(engine.parse, raw)
+    assert msg is not None
@@ -7,10 +7,14 @@ from app.order_book import OrderBook
 from strategies.competitor_strategy import PassiveLiquidityProvider
 from strategies.competitor_strategy1 import MarketMakerStrategy
 from strategies.competitor_strategy2 import MomentumStrategy
+from tests.fake_clock import FakeClock
 
 
 class TestParallelStrategiesSystem(unittest.TestCase):
     def setUp(self):
+        # Fake clock so the simulated gap between cycles costs no real time
+        self.clock = FakeClock(time.time()).install()
+        self.addCleanup(self.clock.uninstall)
         # Shared order book and symbol for all strategies
         self.symbol = "TESTSYM"
         self.order_book = OrderBook(symbol=self.symbol)
@@ -40,15 +44,15 @@ class TestParallelStrategiesSystem(unittest.TestCase):
             symbol=self.symbol,
         )
         # Initial market data
-        self.order_book.asks = {100: [{"qty": 200}]}
-        self.order_book.bids = {99: [{"qty": 200}]}
+        self.order_book.add_order("2", 100, 200, "SEED_ASK", "system")
+        self.order_book.add_order("1", 99, 200, "SEED_BID", "system")
         self.order_book.last_price = 99.5
 
     def run_strategy(self, strategy, n_iters=3):
         for _ in range(n_iters):
             strategy.last_order_time = time.time() - 10  # ensure not in cooldown
             strategy.generate_orders()
-            time.sleep(0.1)  # Simulate time between cycles
+            self.clock.advance(0.1)  # Simulate time between cycles
 
     def test_parallel_strategies(self):
         # Run all strategies in parallel threads
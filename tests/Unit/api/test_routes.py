@@ -1,222 +1,251 @@
+"""
+Unit tests for the Flask routes in api.routes.
+
+PYTEST_DONT_REWRITE: only unittest assertions are used here.
+"""
+
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+from tests.null_lock import NULL_LOCK
+
+# Default trading_state for each test; see _fresh_state for how it is copied
+STATE_TEMPLATE = {
+    "exchange_halted": False,
+    "my_strategy_enabled": True,
+    "current_symbol": "TESTSYM",
+    "order_books": {},
+    "trades": {},
+    "log": [],
+    "order_book_history": {},
+    "spread_history": {},
+    "liquidity_history": {},
+    "latency_history": {},
+    "execution_reports": {},
+    "competition_logs": {},
+}
+# Keys whose empty containers must not be shared between tests
+_CONTAINER_KEYS = tuple(
+    key for key, value in STATE_TEMPLATE.items() if isinstance(value, (dict, list))
+)
+
+
+def _fresh_state():
+    """
+    Shallow-copy STATE_TEMPLATE and swap in new empty containers.
+
+    Cheaper than copy.deepcopy and still gives every test its own dicts/lists.
+    """
+    state = STATE_TEMPLATE.copy()
+    for key in _CONTAINER_KEYS:
+        state[key] = type(STATE_TEMPLATE[key])()
+    return state
+
+
+# (trading_state key, endpoint, per-symbol payload) for the GET routes that return a list
+LIST_ENDPOINTS = [
+    ("trades", "/trades", [{"side": "1", "source": "my_strategy", "price": 100}]),
+    (
+        "order_book_history",
+        "/order_book_history",
+        [
+            {
+                "time": "now",
+                "snapshot": {
+                    "bids": [{"price": 100, "quantity": 10}],
+                    "asks": [{"price": 101, "quantity": 5}],
+                },
+            }
+        ],
+    ),
+    ("spread_history", "/spread_history", [{"time": "now", "mid": 100, "spread": 1}]),
+    ("liquidity_history", "/liquidity_history", [{"time": "now", "liquidity": 1000}]),
+    ("execution_reports", "/execution_reports", [{"source": "my_strategy"}]),
+    ("latency_history", "/order_latency_history", [{"latency": 10}]),
+    ("competition_logs", "/competition_logs", [{"log": "test"}]),
+]
 
-from api import create_app
 
+STATE_TARGET = "api.routes.trading_state"
+LOCK_TARGET = "api.routes.state_lock"
+SYMBOLS_TARGET = "api.routes.symbols"
 
-class TestRoutes(unittest.TestCase):
-    def setUp(self):
-        # Create a test app and client for each test
-        self.app = create_app()
-        self.client = self.app.test_client()
 
-        # Patch the global trading_state and state_lock to avoid threading issues
-        patcher_state = patch(
-            "api.routes.trading_state",
-            {
-                "exchange_halted": False,
-                "my_strategy_enabled": True,
-                "current_symbol": "TESTSYM",
-                "order_books": {},
-                "trades": {},
-                "log": [],
-                "order_book_history": {},
-                "spread_history": {},
-                "liquidity_history": {},
-                "latency_history": {},
-                "execution_reports": {},
-                "competition_logs": {},
-            },
-        )
-        patcher_lock = patch("api.routes.state_lock", MagicMock())
-        self.mock_state = patcher_state.start()
-        self.mock_lock = patcher_lock.start()
-        self.addCleanup(patcher_state.stop)
-        self.addCleanup(patcher_lock.stop)
+class DummyOrderBookForBook:
+    """Book with one level per side, as read by /order_book."""
 
-    def test_toggle_exchange(self):
-        response = self.client.post("/toggle_exchange")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIn("exchange_halted", data)
+    def __init__(self):
+        self.bids = {100: [{"qty": 10, "source": "my_strategy"}]}
+        self.asks = {101: [{"qty": 5, "source": "my_strategy"}]}
+        self.last_price = 100.5
 
-    def test_toggle_my_strategy(self):
-        response = self.client.post("/toggle_my_strategy")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIn("my_strategy_enabled", data)
+
+class DummyOrderBookForStatus:
+    last_price = 101
+
+    def get_mid_price(self):
+        return 101
+
+
+class DummyStrategyForStatus:
+    """Strategy exposing just what /strategy_status reads."""
+
+    def __init__(self):
+        self.realised_pnl = 100
+        self.initial_capital = 10000
+        self.max_inventory = 100
+        self.inventory = 10
+        self.order_book = DummyOrderBookForStatus()
+
+    def get_win_rate(self):
+        return 0.5
+
+    def unrealised_pnl(self):
+        return 50
+
+    def total_pnl(self):
+        return 150
+
+
+class _RoutesBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Imported here so collecting other test modules never loads Flask or api.routes
+        from api import create_app, routes
+
+        cls.routes = routes
+        # Build the Flask app and test client once for the whole class
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+        # Compile the dashboard template up front so test_index hits Jinja's cache
+        cls.app.jinja_env.get_template("index.html")
+
+    def use_test_symbol(self):
+        """
+        Rebind api.routes.symbols to a copy that also maps SYM1 -> TESTSYM.
+        The live dict is never mutated: the background updater iterates it.
+        """
+        patcher = patch(SYMBOLS_TARGET, {**self.routes.symbols, "SYM1": "TESTSYM"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestReadOnlyRoutes(_RoutesBase):
+    """Routes that only read state, so they run against the real globals unpatched."""
 
     def test_cancel_mystrategy_orders_invalid_symbol(self):
         response = self.client.post(
             "/cancel_mystrategy_orders", json={"symbol": "INVALID"}
         )
         self.assertEqual(response.status_code, 400)
-        data = response.get_json()
+        data = response.json
         self.assertEqual(data["status"], "error")
 
     def test_get_status(self):
         response = self.client.get("/status")
         self.assertEqual(response.status_code, 200)
-        data = response.get_json()
+        data = response.json
         self.assertIn("exchange_halted", data)
         self.assertIn("my_strategy_enabled", data)
         self.assertIn("symbol", data)
 
-    def test_get_order_book(self):
-        from api.routes import trading_state
-
-        class DummyOrderBook:
-            def __init__(self):
-                self.bids = {100: [{"qty": 10, "source": "my_strategy"}]}
-                self.asks = {101: [{"qty": 5, "source": "my_strategy"}]}
-                self.last_price = 100.5
+    def test_has_min_depth(self):
+        book_side = {100: [{"qty": 15}], 99: [{"qty": 5}, {"qty": 1}]}
+        self.assertTrue(self.routes.has_min_depth(book_side, 2, 20))
+        self.assertFalse(self.routes.has_min_depth(book_side, 2, 22))
+        self.assertFalse(self.routes.has_min_depth(book_side, 3, 1))
+        # Enough levels but nothing resting still passes a zero quantity floor
+        self.assertTrue(self.routes.has_min_depth({100: [], 99: []}, 2, 0))
 
-        trading_state["order_books"] = {"TESTSYM": DummyOrderBook()}
-        trading_state["current_symbol"] = "TESTSYM"
-        response = self.client.get("/order_book")
+    def test_index(self):
+        self.use_test_symbol()
+        response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIn("bids", data)
-        self.assertIn("asks", data)
-        self.assertIn("last_price", data)
-
-    def test_get_trades(self):
-        from api.routes import trading_state
+        self.assertTrue(response.data)  # Should return HTML
 
-        trading_state["trades"] = {
-            "TESTSYM": [{"side": "1", "source": "my_strategy", "price": 100}]
-        }
-        response = self.client.get("/trades")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
-
-    def test_get_order_book_history(self):
-        from api.routes import trading_state
-
-        trading_state["order_book_history"] = {
-            "TESTSYM": [
-                {
-                    "time": "now",
-                    "snapshot": {
-                        "bids": [{"price": 100, "quantity": 10}],
-                        "asks": [{"price": 101, "quantity": 5}],
-                    },
-                }
-            ]
-        }
-        response = self.client.get("/order_book_history")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
 
-    def test_get_spread_history(self):
-        from api.routes import trading_state
+class TestRoutes(_RoutesBase):
+    def setUp(self):
+        # Patch the global trading_state and state_lock to avoid threading issues
+        patcher_state = patch(STATE_TARGET, _fresh_state())
+        patcher_lock = patch(LOCK_TARGET, NULL_LOCK)
+        # patch() hands back the replacement dict itself; tests write to it directly
+        self.state = patcher_state.start()
+        patcher_lock.start()
+        self.addCleanup(patcher_state.stop)
+        self.addCleanup(patcher_lock.stop)
 
-        trading_state["spread_history"] = {
-            "TESTSYM": [{"time": "now", "mid": 100, "spread": 1}]
-        }
-        response = self.client.get("/spread_history")
+    def test_toggle_exchange(self):
+        response = self.client.post("/toggle_exchange")
         self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
-
-    def test_get_liquidity_history(self):
-        from api.routes import trading_state
+        data = response.json
+        self.assertIn("exchange_halted", data)
 
-        trading_state["liquidity_history"] = {
-            "TESTSYM": [{"time": "now", "liquidity": 1000}]
-        }
-        response = self.client.get("/liquidity_history")
+    def test_toggle_my_strategy(self):
+        response = self.client.post("/toggle_my_strategy")
         self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
-
-    def test_strategy_status(self):
-        from api.routes import strategy_instances, trading_state
-
-        # Define a dummy order book with required attributes/methods
-        class DummyOrderBook:
-            last_price = 101
-
-            def get_mid_price(self):
-                return 101
-
-        # Define DummyStrategy with an order_book attribute
-        class DummyStrategy:
-            def __init__(self):
-                self.realised_pnl = 100
-                self.initial_capital = 10000
-                self.max_inventory = 100
-                self.inventory = 10
-                self.order_book = DummyOrderBook()  # Add this line
-
-            def get_win_rate(self):
-                return 0.5
+        data = response.json
+        self.assertIn("my_strategy_enabled", data)
 
-            def unrealised_pnl(self):
-                return 50
+    def test_get_order_book(self):
+        self.state["order_books"] = {"TESTSYM": DummyOrderBookForBook()}
+        self.state["current_symbol"] = "TESTSYM"
+        response = self.client.get("/order_book")
+        self.assertEqual(response.status_code, 200)
+        data = response.json
+        self.assertIn("bids", data)
+        self.assertIn("asks", data)
+        self.assertIn("last_price", data)
 
-            def total_pnl(self):
-                return 150
+    def test_list_endpoints(self):
+        # One setUp for every list-returning GET route; subTest reports each separately
+        for key, endpoint, payload in LIST_ENDPOINTS:
+            with self.subTest(endpoint=endpoint):
+                self.state[key] = {"TESTSYM": payload}
+                response = self.client.get(endpoint)
+                self.assertEqual(response.status_code, 200)
+                # Shape check only: a JSON array, no need to decode the payload
+                self.assertTrue(response.data.lstrip().startswith(b"["))
 
-        strategy_instances["TESTSYM"] = {"my_strategy": DummyStrategy()}
-        trading_state["trades"] = {"TESTSYM": [{"source": "my_strategy"}]}
+    def test_strategy_status(self):
+        self.routes.strategy_instances["TESTSYM"] = {"my_strategy": DummyStrategyForStatus()}
+        self.state["trades"] = {
+            "TESTSYM": [{"source": "my_strategy"}, {"source": "other"}] * 2
+        }
         response = self.client.get("/strategy_status")
         self.assertEqual(response.status_code, 200)
-        data = response.get_json()
+        data = response.json
         self.assertIn("my_strategy", data)
-
-    def test_get_execution_reports(self):
-        from api.routes import trading_state
-
-        trading_state["execution_reports"] = {"TESTSYM": [{"source": "my_strategy"}]}
-        response = self.client.get("/execution_reports")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
+        self.assertEqual(data["my_strategy"]["total_trades"], 2)
+
+    def test_append_order_book_snapshot(self):
+        from app.order_book import OrderBook
+
+        book = OrderBook("TESTSYM")
+        book.add_order("1", 99.0, 10, "bid1", "test")
+        book.add_order("1", 98.0, 5, "bid2", "test")
+        book.add_order("2", 101.0, 7, "ask1", "test")
+        for key in ("order_book_history", "spread_history", "liquidity_history"):
+            self.state[key]["TESTSYM"] = []
+        self.routes.append_order_book_snapshot("TESTSYM", book)
+        spread = self.state["spread_history"]["TESTSYM"][-1]
+        self.assertEqual((spread["mid"], spread["spread"]), (100.0, 2.0))
+        liquidity = self.state["liquidity_history"]["TESTSYM"][-1]
+        self.assertEqual(liquidity["liquidity"], 22)
 
     def test_select_symbol_valid_and_invalid(self):
-        from api.routes import symbols
-
-        symbols["SYM1"] = "TESTSYM"
+        self.use_test_symbol()
         # Valid symbol
         response = self.client.post("/select_symbol", json={"symbol": "TESTSYM"})
         self.assertEqual(response.status_code, 200)
-        data = response.get_json()
+        data = response.json
         self.assertEqual(data["status"], "symbol_changed")
         # Invalid symbol
         response = self.client.post("/select_symbol", json={"symbol": "INVALID"})
         self.assertEqual(response.status_code, 400)
-        data = response.get_json()
+        data = response.json
         self.assertEqual(data["error"], "Invalid symbol")
 
-    def test_order_latency_history(self):
-        from api.routes import trading_state
-
-        trading_state["latency_history"] = {"TESTSYM": [{"latency": 10}]}
-        response = self.client.get("/order_latency_history")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
-
-    def test_index(self):
-        from api.routes import symbols
-
-        symbols["SYM1"] = "TESTSYM"
-        response = self.client.get("/")
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(response.data)  # Should return HTML
-
-    def test_get_competition_logs(self):
-        from api.routes import trading_state
-
-        trading_state["competition_logs"] = {"TESTSYM": [{"log": "test"}]}
-        response = self.client.get("/competition_logs")
-        self.assertEqual(response.status_code, 200)
-        data = response.get_json()
-        self.assertIsInstance(data, list)
-
 
 if __name__ == "__main__":
     unittest.main()
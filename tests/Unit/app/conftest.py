@@ -0,0 +1,13 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def quiet_market_data_logger():
+    """
+    Swap app.market_data's module logger for a no-op mock once for the session.
+    No test inspects its calls, so there is nothing to reset between tests.
+    """
+    with patch("app.market_data.logger", MagicMock()):
+        yield
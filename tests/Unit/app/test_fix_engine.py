@@ -1,12 +1,10 @@
 import time
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from app.fix_engine import FixEngine
-
-# Patch simplefix globally for all tests using the correct package path
-patcher_simplefix = patch("app.fix_engine.simplefix", autospec=True)
-mock_simplefix = patcher_simplefix.start()
+from tests.fake_clock import FakeClock
 
 
 # DummyFixMessage with all required methods
@@ -24,87 +22,91 @@ class DummyFixMessage:
         return b"42"
 
 
-# Use side_effect so every FixMessage() call returns a DummyFixMessage
-mock_simplefix.FixMessage.side_effect = DummyFixMessage
 MockFixParser = MagicMock()
-mock_simplefix.FixParser.return_value = MockFixParser
 
 
 class TestFixEngine(unittest.TestCase):
-    def setUp(self):
-        # Patch logging to avoid actual log output
-        self.patcher_log = patch(
+    @classmethod
+    def setUpClass(cls):
+        # Patch simplefix and logging once for the class rather than per test
+        # Only FixMessage and FixParser are touched, so no autospec walk of simplefix.
+        # FixMessage is a real class so FixMessage() and isinstance() both work.
+        fake_simplefix = SimpleNamespace(
+            FixMessage=DummyFixMessage, FixParser=lambda: MockFixParser
+        )
+        simplefix_patcher = patch("app.fix_engine.simplefix", new=fake_simplefix)
+        simplefix_patcher.start()
+        cls.addClassCleanup(simplefix_patcher.stop)
+
+        log_patcher = patch(
             "app.fix_engine.logging.getLogger", return_value=MagicMock()
         )
-        self.mock_logger = self.patcher_log.start()
-        self.addCleanup(self.patcher_log.stop)
+        cls.mock_logger = log_patcher.start()
+        cls.addClassCleanup(log_patcher.stop)
 
-        # Create a FixEngine instance for testing
-        self.engine = FixEngine(symbol="TESTSYM", heartbeat_interval=10)
+        # One engine for the class; setUp resets the state tests touch
+        cls.engine = FixEngine(symbol="TESTSYM", heartbeat_interval=10)
 
-        # Reset mocks before each test
-        MockFixParser.reset_mock()
+    def setUp(self):
+        # Reset mocks and mutable engine state before each test
+        MockFixParser.reset_mock(return_value=True, side_effect=True)
+        self.mock_logger.reset_mock()
         self.engine.seq_num = 1
+        self.engine.last_heartbeat = time.time()
 
     def test_init_logs_initialisation(self):
+        # The shared engine's init calls were reset in setUp; build a fresh one
+        engine = FixEngine(symbol="TESTSYM", heartbeat_interval=10)
         self.mock_logger.assert_any_call("FIXServer")
         self.mock_logger.assert_any_call("FIX_TESTSYM")
-        self.assertTrue(self.engine.server_logger.info.called)
-        self.assertTrue(self.engine.strategy_logger.info.called)
+        self.assertTrue(engine.server_logger.info.called)
+        self.assertTrue(engine.strategy_logger.info.called)
 
     def test_create_heartbeat_returns_bytes_and_increments_seq(self):
-        original_encode = DummyFixMessage.encode
-        DummyFixMessage.encode = lambda self: b"FAKEFIX"
-        initial_seq = self.engine.seq_num
-        result = self.engine.create_heartbeat()
-        self.assertEqual(result, b"FAKEFIX")
-        self.assertEqual(self.engine.seq_num, initial_seq + 1)
-        self.assertTrue(self.engine.server_logger.info.called)
-        DummyFixMessage.encode = original_encode
+        with patch.object(DummyFixMessage, "encode", lambda self: b"FAKEFIX"):
+            initial_seq = self.engine.seq_num
+            result = self.engine.create_heartbeat()
+            self.assertEqual(result, b"FAKEFIX")
+            self.assertEqual(self.engine.seq_num, initial_seq + 1)
+            self.assertTrue(self.engine.server_logger.info.called)
 
     def test_create_heartbeat_logs_and_raises_on_exception(self):
-        original_encode = DummyFixMessage.encode
-
         def raise_exc(self):
             raise Exception("encode fail")
 
-        DummyFixMessage.encode = raise_exc
-        with self.assertRaises(Exception):
-            self.engine.create_heartbeat()
+        with patch.object(DummyFixMessage, "encode", raise_exc):
+            with self.assertRaises(Exception):
+                self.engine.create_heartbeat()
         # Can't check .error.called because DummyFixMessage is not a mock
-        DummyFixMessage.encode = original_encode
 
     def test_create_new_order_valid(self):
-        original_encode = DummyFixMessage.encode
-        DummyFixMessage.encode = lambda self: b"ORDERFIX"
-        initial_seq = self.engine.seq_num
-        result = self.engine.create_new_order(
-            cl_ord_id="OID123",
-            symbol="TEST",
-            side="1",
-            price=100.5,
-            qty=10,
-            source="my_strategy",
-        )
-        self.assertEqual(result, b"ORDERFIX")
-        self.assertEqual(self.engine.seq_num, initial_seq + 1)
-        DummyFixMessage.encode = original_encode
+        with patch.object(DummyFixMessage, "encode", lambda self: b"ORDERFIX"):
+            initial_seq = self.engine.seq_num
+            result = self.engine.create_new_order(
+                cl_ord_id="OID123",
+                symbol="TEST",
+                side="1",
+                price=100.5,
+                qty=10,
+                source="my_strategy",
+            )
+            self.assertEqual(result, b"ORDERFIX")
+            self.assertEqual(self.engine.seq_num, initial_seq + 1)
 
     def test_create_new_order_invalid_fields(self):
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("", "TEST", "1", 100, 1, "src")
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("OID", "", "1", 100, 1, "src")
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("OID", "TEST", "X", 100, 1, "src")
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("OID", "TEST", "1", "bad", 1, "src")
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("OID", "TEST", "1", 0.001, 1, "src")
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("OID", "TEST", "1", 100, "bad", "src")
-        with self.assertRaises(ValueError):
-            self.engine.create_new_order("OID", "TEST", "1", 100, 1000000, "src")
+        # Each case breaks exactly one field; subTest reports which one failed
+        cases = [
+            ("", "TEST", "1", 100, 1, "src"),  # empty ClOrdID
+            ("OID", "", "1", 100, 1, "src"),  # empty symbol
+            ("OID", "TEST", "X", 100, 1, "src"),  # unknown side
+            ("OID", "TEST", "1", "bad", 1, "src"),  # non-numeric price
+            ("OID", "TEST", "1", 0.001, 1, "src"),  # price below minimum
+            ("OID", "TEST", "1", 100, "bad", "src"),  # non-numeric quantity
+            ("OID", "TEST", "1", 100, 1000000, "src"),  # quantity above maximum
+        ]
+        for args in cases:
+            with self.subTest(args=args), self.assertRaises(ValueError):
+                self.engine.create_new_order(*args)
 
     def test_parse_success_and_seq_update(self):
         msg = DummyFixMessage()
@@ -143,38 +145,37 @@ class TestFixEngine(unittest.TestCase):
         self.assertTrue(self.engine.server_logger.debug.called)
 
     def test_create_execution_report(self):
-        original_encode = DummyFixMessage.encode
-        DummyFixMessage.encode = lambda self: b"EXECFIX"
-        initial_seq = self.engine.seq_num
-        result = self.engine.create_execution_report(
-            cl_ord_id="OID123",
-            order_id="OID456",
-            exec_id="EID789",
-            ord_status="0",
-            exec_type="0",
-            symbol="TEST",
-            side="1",
-            order_qty=10,
-            last_qty=5,
-            last_px=101.0,
-            leaves_qty=5,
-            cum_qty=5,
-            price=101.0,
-            source="my_strategy",
-            text="Filled",
-        )
-        self.assertEqual(result, b"EXECFIX")
-        self.assertEqual(self.engine.seq_num, initial_seq + 1)
-        DummyFixMessage.encode = original_encode
+        with patch.object(DummyFixMessage, "encode", lambda self: b"EXECFIX"):
+            initial_seq = self.engine.seq_num
+            result = self.engine.create_execution_report(
+                cl_ord_id="OID123",
+                order_id="OID456",
+                exec_id="EID789",
+                ord_status="0",
+                exec_type="0",
+                symbol="TEST",
+                side="1",
+                order_qty=10,
+                last_qty=5,
+                last_px=101.0,
+                leaves_qty=5,
+                cum_qty=5,
+                price=101.0,
+                source="my_strategy",
+                text="Filled",
+            )
+            self.assertEqual(result, b"EXECFIX")
+            self.assertEqual(self.engine.seq_num, initial_seq + 1)
 
     def test_update_heartbeat(self):
-        old_time = self.engine.last_heartbeat
-        time.sleep(0.01)
-        self.engine.update_heartbeat()
-        self.assertGreater(self.engine.last_heartbeat, old_time)
+        self.engine.last_heartbeat = 1000.0
+        # Advance a fake clock instead of sleeping so the timestamp visibly moves
+        with FakeClock(1000.0) as clock:
+            clock.advance(0.5)
+            self.engine.update_heartbeat()
+        self.assertEqual(self.engine.last_heartbeat, 1000.5)
         self.assertTrue(self.engine.server_logger.debug.called)
 
 
 if __name__ == "__main__":
-    patcher_simplefix.stop()  # Clean up global patch
     unittest.main()
@@ -1,52 +1,51 @@
+import copy
 import json
-import os
 import stat
-import threading
+import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import mock_open, patch
 
 import app.market_data
+from tests.null_lock import NULL_LOCK
+
+# app.market_data globals that tests overwrite; setUp restores them after each test
+MUTABLE_GLOBALS = ("api_calls_today", "last_call_date", "latest_prices", "SYMBOLS")
+
+
+def _restore_globals(snapshot):
+    for name, value in snapshot.items():
+        setattr(app.market_data, name, value)
 
 
 class TestMarketData(unittest.TestCase):
     def setUp(self):
-        # Patch logger to avoid cluttering test output
-        patcher = patch("app.market_data.logger")
-        self.mock_logger = patcher.start()
-        self.addCleanup(patcher.stop)
-
+        # app.market_data.logger is silenced once per session in conftest.py
         # Patch threading.Lock for latest_prices_lock and api_counter_lock
         self.lock_patch = patch(
             "app.market_data.threading.Lock",
-            return_value=MagicMock(spec=threading.Lock),
+            return_value=NULL_LOCK,
         )
         self.lock_patch.start()
         self.addCleanup(self.lock_patch.stop)
 
-        # Patch DATA_DIR_RAW and API_COUNT_FILE to use a temp directory
-        self.temp_dir = "temp_test_data"
-        os.makedirs(self.temp_dir, exist_ok=True)
-        patcher_data_dir = patch(
-            "app.market_data.DATA_DIR_RAW",
-            new_callable=lambda: Path(os.path.abspath(self.temp_dir)),
-        )
+        # Patch DATA_DIR_RAW and API_COUNT_FILE to use a throwaway temp directory
+        self.temp_dir = self.enterContext(tempfile.TemporaryDirectory())
+        patcher_data_dir = patch("app.market_data.DATA_DIR_RAW", Path(self.temp_dir))
         patcher_api_count = patch(
             "app.market_data.API_COUNT_FILE",
-            new_callable=lambda: Path(
-                os.path.join(self.temp_dir, "api_calls_today.json")
-            ),
+            Path(self.temp_dir) / "api_calls_today.json",
         )
         patcher_data_dir.start()
         patcher_api_count.start()
         self.addCleanup(patcher_data_dir.stop)
         self.addCleanup(patcher_api_count.stop)
 
-    def tearDown(self):
-        # Clean up temp directory
-        for f in os.listdir(self.temp_dir):
-            os.remove(os.path.join(self.temp_dir, f))
-        os.rmdir(self.temp_dir)
+        # Snapshot the module globals tests mutate and put them back afterwards
+        snapshot = {
+            name: copy.copy(getattr(app.market_data, name)) for name in MUTABLE_GLOBALS
+        }
+        self.addCleanup(_restore_globals, snapshot)
 
     @patch("app.market_data.open", new_callable=mock_open, create=True)
     def test_save_and_load_api_count(self, mock_file):
@@ -88,16 +87,17 @@ class TestMarketData(unittest.TestCase):
     def test_load_cached_data_expiry(self, mock_time, mock_file):
         """Test that expired cache is not loaded."""
         symbol = "TEST"
-        cache_file = os.path.join(self.temp_dir, f"{symbol}_20240101_000000.json")
-        with open(cache_file, "w") as f:
-            json.dump({"dummy": "data"}, f)
-        # Patch Path.stat to return a dummy stat object with st_mtime and st_mode
+        cache_file = Path(self.temp_dir) / f"{symbol}_20240101_000000.json"
 
+        # Patch Path.stat to return a dummy stat object with st_mtime and st_mode
         class DummyStat:
             st_mtime = 0
             st_mode = stat.S_IFREG  # Regular file
 
-        with patch.object(Path, "stat", return_value=DummyStat()):
+        # The cache file is never read, so list it via glob instead of writing it
+        with patch.object(Path, "glob", return_value=[cache_file]), patch.object(
+            Path, "stat", return_value=DummyStat()
+        ):
             mock_time.time.return_value = 2000000000
             result = app.market_data.load_cached_data(symbol)
             self.assertIsNone(result)
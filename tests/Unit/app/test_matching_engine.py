@@ -1,8 +1,16 @@
 import time
 import unittest
+from collections import deque
+from threading import Lock
 from unittest.mock import MagicMock
 
 from app.matching_engine import MatchingEngine, TradingHalted
+from app.order_book import OrderBook
+
+
+def _ask(qty, src="maker", oid="maker_order", t=0):
+    # Fresh single-order price level as the matching engine expects it
+    return deque([{"id": oid, "qty": qty, "source": src, "order_time": t}])
 
 
 # Minimal stub for OrderBook for testing
@@ -17,8 +25,6 @@ class DummyOrderBook:
         # Add an order to the bids or asks book
         book = self.bids if side == "buy" else self.asks
         if price not in book:
-            from collections import deque
-
             book[price] = deque()
         book[price].append(
             {
@@ -29,6 +35,10 @@ class DummyOrderBook:
             }
         )
 
+    def refresh_top(self):
+        # The stub publishes no top-of-book; nothing to republish
+        pass
+
 
 # Minimal stub for Strategy for testing
 class DummyStrategy:
@@ -48,20 +58,33 @@ class DummyStrategy:
 
 
 class TestMatchingEngine(unittest.TestCase):
-    def setUp(self):
-        # Set up a dummy order book and two dummy strategies
-        self.order_book = DummyOrderBook()
-        self.strategies = {
+    @classmethod
+    def setUpClass(cls):
+        # Build the book, strategies and engine once; setUp resets their state
+        cls.order_book = DummyOrderBook()
+        cls.strategies = {
             "maker": DummyStrategy("maker"),
             "taker": DummyStrategy("taker"),
         }
-        self.engine = MatchingEngine(self.order_book, self.strategies)
+        cls.engine = MatchingEngine(cls.order_book, cls.strategies)
+
+    def setUp(self):
+        self.order_book.bids.clear()
+        self.order_book.asks.clear()
+        self.order_book.last_price = None
+        for strategy in self.strategies.values():
+            strategy.inventory = 0
+            strategy.avg_entry_price = 0.0
+            strategy.realised_pnl = 0.0
+            strategy.fix_engine.reset_mock()
+            strategy.logger.reset_mock()
+        breaker = self.engine.circuit_breaker
+        breaker.daily_loss = 0.0
+        breaker.order_count = 0
 
     def test_circuit_breaker_blocks_when_limit_hit(self):
         """Test that TradingHalted is raised when circuit breaker triggers."""
         self.engine.circuit_breaker.daily_loss = -10001  # Exceed max_daily_loss
-        from collections import deque
-
         self.order_book.asks[101.0] = deque()
         with self.assertRaises(TradingHalted):
             self.engine.match_order("buy", 101.0, 1, "oid", "taker")
@@ -69,11 +92,7 @@ class TestMatchingEngine(unittest.TestCase):
     def test_simple_match_and_pnl(self):
         """Test a simple match and correct PnL calculation."""
         # Maker posts an ask at 101.0
-        from collections import deque
-
-        self.order_book.asks[101.0] = deque(
-            [{"id": "maker_order", "qty": 5, "source": "maker", "order_time": 0}]
-        )
+        self.order_book.asks[101.0] = _ask(5)
         # Taker submits a buy at 101.0
         trades = self.engine.match_order("buy", 101.0, 3, "taker_order", "taker")
         self.assertEqual(len(trades), 1)
@@ -89,11 +108,7 @@ class TestMatchingEngine(unittest.TestCase):
 
     def test_self_trade_prevention(self):
         """Test that self-trading is prevented."""
-        from collections import deque
-
-        self.order_book.asks[101.0] = deque(
-            [{"id": "maker_order", "qty": 5, "source": "maker", "order_time": 0}]
-        )
+        self.order_book.asks[101.0] = _ask(5)
         # Maker tries to take their own order
         trades = self.engine.match_order("buy", 101.0, 2, "maker_order2", "maker")
         # Should result in no trade (self-trade prevention)
@@ -101,14 +116,8 @@ class TestMatchingEngine(unittest.TestCase):
 
     def test_partial_and_full_fill(self):
         """Test partial and full fills are handled correctly."""
-        from collections import deque
-
-        self.order_book.asks[101.0] = deque(
-            [
-                {"id": "ask1", "qty": 2, "source": "maker", "order_time": 0},
-                {"id": "ask2", "qty": 3, "source": "maker", "order_time": 0},
-            ]
-        )
+        self.order_book.asks[101.0] = _ask(2, oid="ask1")
+        self.order_book.asks[101.0].extend(_ask(3, oid="ask2"))
         # Taker submits a buy for 4 units at 101.0
         trades = self.engine.match_order("buy", 101.0, 4, "taker_order", "taker")
         self.assertEqual(len(trades), 2)
@@ -117,42 +126,102 @@ class TestMatchingEngine(unittest.TestCase):
         # The remaining ask2 should have qty 1 left
         self.assertEqual(self.order_book.asks[101.0][0]["qty"], 1)
 
+    def test_exec_ids_unique_per_report(self):
+        """Test every execution report from a multi-fill match gets its own ExecID."""
+        self.order_book.asks[101.0] = _ask(2, oid="ask1")
+        self.order_book.asks[101.0].extend(_ask(3, oid="ask2"))
+        self.engine.match_order("buy", 101.0, 4, "taker_order", "taker")
+        exec_ids = [
+            call.kwargs["exec_id"]
+            for strategy in self.strategies.values()
+            for call in strategy.fix_engine.create_execution_report.call_args_list
+        ]
+        self.assertEqual(len(exec_ids), 4)  # maker and taker report per fill
+        self.assertEqual(len(set(exec_ids)), 4)
+
     def test_no_match_when_price_is_too_low(self):
         """Test that no match occurs if the price is not aggressive enough."""
-        from collections import deque
-
-        self.order_book.asks[102.0] = deque(
-            [{"id": "maker_order", "qty": 5, "source": "maker", "order_time": 0}]
-        )
+        self.order_book.asks[102.0] = _ask(5)
         # Taker submits a buy at 101.0 (not high enough)
         trades = self.engine.match_order("buy", 101.0, 5, "taker_order", "taker")
         self.assertEqual(trades, [])
 
     def test_latency_tracking(self):
         """Test that latency is tracked in trade dict."""
-        from collections import deque
-
-        self.order_book.asks[101.0] = deque(
-            [
-                {
-                    "id": "maker_order",
-                    "qty": 1,
-                    "source": "maker",
-                    "order_time": time.time() - 0.01,  # 10ms ago
-                }
-            ]
-        )
+        self.order_book.asks[101.0] = _ask(1, t=time.time() - 0.01)  # 10ms ago
         trades = self.engine.match_order("buy", 101.0, 1, "taker_order", "taker")
         self.assertIn("latency_ms", trades[0])
         self.assertIsInstance(trades[0]["latency_ms"], float)
 
+    def test_sorted_book_fills_best_level_first(self):
+        """Test a real OrderBook's sorted levels are matched best price first."""
+        book = OrderBook("TESTSYM")
+        for level_price in (103.0, 101.0, 102.0):
+            book.asks[level_price] = _ask(1, oid=f"ask{level_price}")
+        for level_price in (97.0, 99.0, 98.0):
+            book.bids[level_price] = _ask(1, oid=f"bid{level_price}")
+        engine = MatchingEngine(book, self.strategies)
+        trades = engine.match_order("buy", 103.0, 1, "taker_order", "taker")
+        self.assertEqual(trades[0]["price"], 101.0)
+        trades = engine.match_order("sell", 98.0, 1, "taker_order2", "taker")
+        self.assertEqual(trades[0]["price"], 99.0)
+        # Nothing crosses: no level is walked, let alone filled
+        self.assertEqual(engine.match_order("sell", 100.0, 1, "t3", "taker"), [])
+
+    def test_latency_history_recorded_under_lock(self):
+        """Test a fill records taker latency even when the maker has no order_time."""
+        state = {}
+        engine = MatchingEngine(
+            self.order_book, self.strategies, trading_state=state, state_lock=Lock()
+        )
+        self.order_book.asks[101.0] = _ask(1)  # order_time 0: no maker sample
+        engine.match_order("buy", 101.0, 1, "taker_order", "taker")
+        samples = state["latency_history"]["TESTSYM"]
+        self.assertEqual([sample["type"] for sample in samples], ["taker"])
+
+    def test_drained_level_removed_and_top_refreshed(self):
+        """Test a fully filled level leaves the book and the published top moves on."""
+        book = OrderBook("TESTSYM")
+        book.add_order("2", 101.0, 1, "ask1", "maker")
+        book.add_order("2", 102.0, 1, "ask2", "maker")
+        engine = MatchingEngine(book, self.strategies)
+        engine.match_order("buy", 101.0, 1, "taker_order", "taker")
+        self.assertNotIn(101.0, book.asks)
+        self.assertEqual(book.top(), (None, 102.0))
+
+    def test_top_refreshed_when_match_raises(self):
+        """Test drained levels leave the book and the top even if matching raises."""
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("failed mid-match")
+
+        class FailingMaker(DummyStrategy):
+            def on_trade(self, trade):
+                if trade["price"] == 102.0:
+                    fail()
+
+        # The second level's callback raises, or the residual add raises right
+        # after the first level's last order was popped
+        cases = [
+            ("callback", FailingMaker("maker"), lambda *args: None),
+            ("residual add", DummyStrategy("maker"), fail),
+        ]
+        for name, maker, add_order in cases:
+            with self.subTest(raised_by=name):
+                book = OrderBook("TESTSYM")
+                book.add_order("2", 101.0, 1, "ask1", "maker")
+                book.add_order("2", 102.0, 1, "ask2", "maker")
+                book.add_order = add_order
+                strategies = {"maker": maker, "taker": DummyStrategy("taker")}
+                engine = MatchingEngine(book, strategies)
+                with self.assertRaises(RuntimeError):
+                    engine.match_order("buy", 102.0, 2, "taker_order", "taker")
+                self.assertNotIn(101.0, book.asks)
+                self.assertEqual(book.top(), (None, 102.0))
+
     def test_trade_history_and_last_price(self):
         """Test that last_price is updated after trade."""
-        from collections import deque
-
-        self.order_book.asks[101.0] = deque(
-            [{"id": "maker_order", "qty": 1, "source": "maker", "order_time": 0}]
-        )
+        self.order_book.asks[101.0] = _ask(1)
         self.engine.match_order("buy", 101.0, 1, "taker_order", "taker")
         self.assertEqual(self.order_book.last_price, 101.0)
 
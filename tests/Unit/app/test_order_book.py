@@ -1,13 +1,17 @@
 import time
 import unittest
 
-from app.order_book import OrderBook
+from app.order_book import TRADE_HISTORY_LIMIT, OrderBook
 
 
 class TestOrderBook(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Build the order book once; setUp empties it before each test
+        cls.book = OrderBook("TESTSYM")
+
     def setUp(self):
-        # Create a fresh order book for each test
-        self.book = OrderBook("TESTSYM")
+        self.book.reset()
 
     def test_add_and_best_bid_ask(self):
         """Test adding orders and retrieving best bid/ask."""
@@ -20,6 +24,16 @@ class TestOrderBook(unittest.TestCase):
         self.assertEqual(best_ask["price"], 101.0)
         self.assertEqual(best_ask["qty"], 5)
 
+    def test_best_bid_ask_across_levels(self):
+        """Test best bid is the highest and best ask the lowest of several levels."""
+        self.book.add_order("1", 99.0, 1, "bid1", "test")
+        self.book.add_order("1", 100.0, 2, "bid2", "test")
+        self.book.add_order("1", 100.0, 3, "bid3", "test")
+        self.book.add_order("2", 102.0, 4, "ask1", "test")
+        self.book.add_order("2", 101.0, 5, "ask2", "test")
+        self.assertEqual(self.book.get_best_bid(), {"price": 100.0, "qty": 5})
+        self.assertEqual(self.book.get_best_ask(), {"price": 101.0, "qty": 5})
+
     def test_empty_order_book_best_bid_ask(self):
         """Test best bid/ask returns None on empty order book."""
         self.assertIsNone(self.book.get_best_bid())
@@ -39,9 +53,13 @@ class TestOrderBook(unittest.TestCase):
 
     def test_depth_snapshot(self):
         """Test that get_depth_snapshot returns correct levels."""
-        self.book.add_order("1", 100.0, 10, "bid1", "test")
-        self.book.add_order("1", 99.5, 5, "bid2", "test")
-        self.book.add_order("2", 101.0, 8, "ask1", "test")
+        self.book._seed_bulk(
+            [
+                ("1", 100.0, 10, "bid1", "test"),
+                ("1", 99.5, 5, "bid2", "test"),
+                ("2", 101.0, 8, "ask1", "test"),
+            ]
+        )
         snap = self.book.get_depth_snapshot(levels=2)
         self.assertEqual(len(snap["bids"]), 2)
         self.assertEqual(len(snap["asks"]), 1)
@@ -58,6 +76,15 @@ class TestOrderBook(unittest.TestCase):
         all_prices = self.book.get_recent_prices(window=20)
         self.assertEqual(all_prices, list(range(50, 60)))
 
+    def test_trade_history_is_bounded(self):
+        """Test the trade history keeps only the most recent prices up to its limit."""
+        for price in range(TRADE_HISTORY_LIMIT + 5):
+            self.book.record_trade(price)
+        self.assertEqual(len(self.book.trade_history), TRADE_HISTORY_LIMIT)
+        self.assertEqual(self.book.trade_history[0], 5)
+        recent = self.book.get_recent_prices(window=2)
+        self.assertEqual(recent, [TRADE_HISTORY_LIMIT + 3, TRADE_HISTORY_LIMIT + 4])
+
     def test_seed_synthetic_depth(self):
         """Test seeding synthetic depth creates expected levels."""
         self.book.seed_synthetic_depth(mid_price=100.0, levels=3, base_qty=100)
@@ -80,6 +107,25 @@ class TestOrderBook(unittest.TestCase):
         empty_book = OrderBook("EMPTY")
         self.assertIsNone(empty_book.get_mid_price())
 
+    def test_top_snapshot_tracks_best_levels(self):
+        """Test the published top-of-book follows level adds and removals."""
+        self.assertEqual(self.book.top(), (None, None))
+        self.book.add_order("1", 99.0, 10, "bid1", "test")
+        self.book.add_order("1", 100.0, 10, "bid2", "test")
+        self.book.add_order("2", 101.0, 10, "ask1", "test")
+        self.assertEqual(self.book.top(), (100.0, 101.0))
+        self.book.remove_order("bid2")
+        self.assertEqual(self.book.top(), (99.0, 101.0))
+
+    def test_seed_bulk_matches_add_order(self):
+        """Test bulk seeding builds the same levels, order map and top as add_order."""
+        self.book._seed_bulk(
+            [("1", 100.0, 10, "bid1", "A"), ("2", 101.0, 5, "ask1", "B")]
+        )
+        self.assertEqual(self.book.top(), (100.0, 101.0))
+        self.assertEqual(self.book.order_map["bid1"], (100.0, "buy"))
+        self.assertEqual(self.book.get_order_source("ask1"), "B")
+
     def test_expire_old_orders(self):
         """Test that old orders are expired correctly."""
         now = time.time()
@@ -100,6 +146,30 @@ class TestOrderBook(unittest.TestCase):
         # Removing again should return None
         self.assertIsNone(self.book.remove_order("bid1"))
 
+    def test_remove_order_keeps_level_fifo(self):
+        """Test removing a mid-queue order leaves the rest of the level in order."""
+        for oid in ("bid1", "bid2", "bid3"):
+            self.book.add_order("1", 100.0, 10, oid, "test")
+        level = self.book.bids[100.0]
+        self.book.remove_order("bid2")
+        self.assertIs(self.book.bids[100.0], level)
+        self.assertEqual([order["id"] for order in level], ["bid1", "bid3"])
+        self.assertNotIn("bid2", self.book.order_map)
+
+    def test_reset_empties_book(self):
+        """Test reset clears levels, order map, trade history and the published top."""
+        self.book.add_order("1", 100.0, 10, "bid1", "test")
+        self.book.add_order("2", 101.0, 5, "ask1", "test")
+        self.book.record_trade(100.5)
+        self.book.last_price = 100.5
+        bids = self.book.bids
+        self.book.reset()
+        self.assertIs(self.book.bids, bids)
+        self.assertFalse(self.book.bids or self.book.asks or self.book.order_map)
+        self.assertEqual(self.book.get_recent_prices(), [])
+        self.assertIsNone(self.book.last_price)
+        self.assertEqual(self.book.top(), (None, None))
+
     def test_get_order_source(self):
         """Test retrieving the source of an order."""
         self.book.add_order("1", 100.0, 10, "bid1", "strategyA")
@@ -108,9 +178,13 @@ class TestOrderBook(unittest.TestCase):
 
     def test_get_orders_by_source(self):
         """Test retrieving all orders for a given side and source."""
-        self.book.add_order("1", 100.0, 10, "bid1", "A")
-        self.book.add_order("1", 99.5, 5, "bid2", "B")
-        self.book.add_order("2", 101.0, 8, "ask1", "A")
+        self.book._seed_bulk(
+            [
+                ("1", 100.0, 10, "bid1", "A"),
+                ("1", 99.5, 5, "bid2", "B"),
+                ("2", 101.0, 8, "ask1", "A"),
+            ]
+        )
         bids_A = self.book.get_orders_by_source("buy", "A")
         asks_A = self.book.get_orders_by_source("sell", "A")
         self.assertEqual(len(bids_A), 1)
@@ -0,0 +1,144 @@
+"""
+Shared test doubles for the strategy unit tests.
+"""
+
+import copy
+import functools
+import importlib
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+from tests.fake_clock import FakeClock
+
+# String target so patching does not need BaseStrategy imported at module level
+BASE_ON_TRADE = "strategies.base_strategy.BaseStrategy.on_trade"
+
+# Logger mocks are spec_set so only these attributes exist
+LOGGER_METHODS = ("info", "warning", "error", "debug")
+
+
+class DummyOrderBook:
+    # Book fields live in slots; __dict__ only materialises when a test
+    # overrides a method on the instance (e.g. get_best_bid = lambda: None)
+    __slots__ = ("bids", "asks", "last_price", "__dict__")
+
+    def __init__(self):
+        self.bids = {100: [{"qty": 500}], 99: [{"qty": 300}]}
+        self.asks = {101: [{"qty": 400}], 102: [{"qty": 200}]}
+        self.last_price = 100.5
+
+    def __copy__(self):
+        """
+        Copy of the slotted fields only, so tests can clone a prebuilt prototype
+        instead of running __init__ every time. The price levels (and any list
+        slot a subclass adds) are rebuilt, so a clone that adds or pops a level
+        or order never reaches back into the prototype.
+        Per-instance method overrides are deliberately not carried over.
+        """
+        new = object.__new__(type(self))
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if name == "__dict__" or not hasattr(self, name):
+                    continue
+                value = getattr(self, name)
+                if name in ("bids", "asks"):
+                    value = {
+                        price: [dict(order) for order in level]
+                        for price, level in value.items()
+                    }
+                elif isinstance(value, list):
+                    value = list(value)
+                setattr(new, name, value)
+        return new
+
+    def get_best_bid(self):
+        return {"price": 100}
+
+    def get_best_ask(self):
+        return {"price": 101}
+
+    def get_mid_price(self):
+        best_bid = self.get_best_bid()
+        best_ask = self.get_best_ask()
+        if best_bid is None or best_ask is None:
+            return None
+        return (best_bid["price"] + best_ask["price"]) / 2
+
+
+# One prototype per book class, built on first use and only ever copied
+_PROTO_BOOKS = {}
+
+
+def make_book(book_class=DummyOrderBook):
+    """
+    Fresh dummy order book for one test, cloned from a per-class prototype.
+    Args:
+        book_class (type): DummyOrderBook or a test module's subclass of it.
+    Returns:
+        DummyOrderBook: An independent copy the test may mutate freely.
+    """
+    proto = _PROTO_BOOKS.get(book_class)
+    if proto is None:
+        proto = _PROTO_BOOKS[book_class] = book_class()
+    return copy.copy(proto)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_parse(side, price, qty):
+    # Read-only so a caller cannot corrupt the cached message for later tests
+    return MappingProxyType({54: side, 44: price, 38: qty, 11: "OID"})
+
+
+class DummyFixEngine:
+    def create_new_order(self, **kwargs):
+        return {"fake": "msg"}
+
+    def parse(self, **kwargs):
+        # Simulate parsed FIX message; identical fields share one cached result
+        return _cached_parse(
+            kwargs.get("side", "1"), kwargs.get("price", 100), kwargs.get("qty", 1)
+        )
+
+
+def make_logger_mock():
+    """
+    Logger stand-in whose calls can be asserted; any other attribute raises.
+    """
+    return MagicMock(spec_set=LOGGER_METHODS)
+
+
+class StrategyTestMixin:
+    """
+    Shared fixture for the strategy TestCases: one strategy is built per class
+    under a frozen clock, and each test works on a shallow copy of it wired to a
+    fresh DummyFixEngine and a cloned book.
+
+    Subclasses set strategy_path ("module.Class", imported lazily so collecting
+    other test modules never loads the strategies tree), strategy_args (the
+    constructor arguments after the fix engine and order book) and, if they use
+    their own dummy book, book_class.
+    """
+
+    strategy_path = None
+    strategy_args = ()
+    book_class = DummyOrderBook
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Freeze the clock for the whole class instead of patching per test
+        cls.clock = FakeClock(1000.0).install()
+        cls.addClassCleanup(cls.clock.uninstall)
+        module_name, class_name = cls.strategy_path.rsplit(".", 1)
+        strategy_class = getattr(importlib.import_module(module_name), class_name)
+        cls._prototype = strategy_class(
+            DummyFixEngine(), cls.book_class(), *cls.strategy_args
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.fix_engine = DummyFixEngine()
+        self.order_book = make_book(self.book_class)
+        self.strategy = copy.copy(self._prototype)
+        self.strategy.fix_engine = self.fix_engine
+        self.strategy.order_book = self.order_book
@@ -1,27 +1,24 @@
-import time
+"""
+Unit tests for BaseStrategy.
+
+PYTEST_DONT_REWRITE: only unittest assertions are used here.
+"""
+
 import unittest
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
-# Assume BaseStrategy is imported from the file
-from strategies.base_strategy import BaseStrategy
+from tests.Unit.strategies import _dummies
+from tests.Unit.strategies._dummies import StrategyTestMixin
 
 
-class DummyOrderBook:
+class DummyOrderBook(_dummies.DummyOrderBook):
+    __slots__ = ("_recent_prices",)
+
     def __init__(self):
-        self.bids = {100: [{"qty": 500}], 99: [{"qty": 300}]}
-        self.asks = {101: [{"qty": 400}], 102: [{"qty": 200}]}
-        self.last_price = 100.5
+        super().__init__()
         self._recent_prices = [100, 101, 100.5, 99.5, 100.2]
 
-    def get_best_bid(self):
-        return {"price": 100}
-
-    def get_best_ask(self):
-        return {"price": 101}
-
-    def get_mid_price(self):
-        return 100.5
-
     def add_order(self, **kwargs):
         pass
 
@@ -29,27 +26,17 @@ class DummyOrderBook:
         return self._recent_prices[-window:]
 
 
-class DummyFixEngine:
-    def create_new_order(self, **kwargs):
-        return {"fake": "msg"}
-
-    def parse(self, **kwargs):
-        # Simulate parsed FIX message
-        return {
-            54: kwargs.get("side", "1"),
-            44: kwargs.get("price", 100),
-            38: kwargs.get("qty", 1),
-            11: "OID",
-        }
+# Read-only fills for the trailing stop test (stop at 1% below a 110 high)
+_TRADE_HOLD = MappingProxyType({"qty": 0, "side": "1", "price": 109, "pnl": 0})
+_TRADE_TRIGGER = MappingProxyType({"qty": 0, "side": "1", "price": 107, "pnl": 0})
 
 
-class TestBaseStrategy(unittest.TestCase):
-    def setUp(self):
-        self.fix_engine = DummyFixEngine()
-        self.order_book = DummyOrderBook()
-        self.symbol = "TEST"
-        self.source_name = "TestSource"
-        self.params = {
+class TestBaseStrategy(StrategyTestMixin, unittest.TestCase):
+    strategy_path = "strategies.base_strategy.BaseStrategy"
+    strategy_args = (
+        "TEST",
+        "TestSource",
+        {
             "max_order_qty": 100,
             "max_price_deviation": 0.05,
             "max_daily_orders": 5,
@@ -59,10 +46,9 @@ class TestBaseStrategy(unittest.TestCase):
             "cooldown_period": 1,
             "daily_loss_limit": -1000,
             "trailing_stop": 0.01,
-        }
-        self.strategy = BaseStrategy(
-            self.fix_engine, self.order_book, self.symbol, self.source_name, self.params
-        )
+        },
+    )
+    book_class = DummyOrderBook
 
     def test_initialization_defaults(self):
         self.assertEqual(self.strategy.max_order_qty, 100)
@@ -84,7 +70,7 @@ class TestBaseStrategy(unittest.TestCase):
         self.assertFalse(self.strategy._risk_check("1", 101, 10))
 
     def test_risk_check_position_duration(self):
-        self.strategy.position_start_time = time.time() - 120
+        self.strategy.position_start_time = self.clock.time() - 120
         self.assertFalse(self.strategy._risk_check("1", 101, 10))
 
     def test_risk_check_daily_loss_limit(self):
@@ -99,8 +85,7 @@ class TestBaseStrategy(unittest.TestCase):
         with patch.object(self.strategy, "_current_volatility", return_value=0.2):
             self.assertFalse(self.strategy._risk_check("1", 101, 10))
 
-    @patch("time.time", return_value=1000)
-    def test_place_order_success(self, mock_time):
+    def test_place_order_success(self):
         # Patch fix_engine and order_book to simulate order placement
         self.strategy.last_order_time = 998
         self.strategy._risk_check = MagicMock(return_value=True)
@@ -112,8 +97,7 @@ class TestBaseStrategy(unittest.TestCase):
         self.assertTrue(self.strategy.place_order("1", 101, 10))
         self.assertEqual(self.strategy.order_count, 1)
 
-    @patch("time.time", return_value=1000)
-    def test_place_order_cooldown(self, mock_time):
+    def test_place_order_cooldown(self):
         self.strategy.last_order_time = 999.95
         self.assertFalse(self.strategy.place_order("1", 101, 10))
 
@@ -139,23 +123,14 @@ class TestBaseStrategy(unittest.TestCase):
         self.assertEqual(self.strategy.avg_entry_price, 0.0)
 
     def test_trailing_stop_logic(self):
-        # Open long, simulate price drop for trailing stop
+        # Open long, then feed one fill above and one below the trailing stop
         self.strategy.inventory = 10
         self.strategy.avg_entry_price = 100
         self.strategy.highest_price = 110
-        trade = {"qty": 0, "side": "1", "price": 109, "pnl": 0}
-        self.strategy.on_trade(trade)
-        # Should not reset
+        self.strategy.on_trade(_TRADE_HOLD)
+        # Within 1% of the high, position is kept
         self.assertEqual(self.strategy.inventory, 10)
-        trade = {"qty": 0, "side": "1", "price": 109, "pnl": 0}
-        self.strategy.on_trade(trade)
-        # Drop below trailing stop
-        trade = {"qty": 0, "side": "1", "price": 109, "pnl": 0}
-        self.strategy.highest_price = 110
-        self.strategy.on_trade({"qty": 0, "side": "1", "price": 109, "pnl": 0})
-        # Now drop below trailing stop
-        trade = {"qty": 0, "side": "1", "price": 107, "pnl": 0}
-        self.strategy.on_trade(trade)
+        self.strategy.on_trade(_TRADE_TRIGGER)
         # Inventory should reset
         self.assertEqual(self.strategy.inventory, 0)
 
@@ -185,6 +160,22 @@ class TestBaseStrategy(unittest.TestCase):
             size = self.strategy.get_adaptive_order_size(min_size=1, max_size=10)
             self.assertTrue(1 <= size <= 10)
 
+    def test_adaptive_order_size_cached_within_ttl(self):
+        with patch.object(
+            self.strategy, "_current_volatility", return_value=0.05
+        ) as mock_vol:
+            first = self.strategy.get_adaptive_order_size(min_size=1, max_size=10)
+            second = self.strategy.get_adaptive_order_size(min_size=1, max_size=10)
+            self.assertEqual(first, second)
+            self.assertEqual(mock_vol.call_count, 1)
+            # Different arguments bypass the cache
+            self.strategy.get_adaptive_order_size(min_size=1, max_size=20)
+            self.assertEqual(mock_vol.call_count, 2)
+            # With no explicit cap, a new max_order_qty also bypasses the cache
+            self.assertEqual(self.strategy.get_adaptive_order_size(min_size=1), 100)
+            self.strategy.max_order_qty = 50
+            self.assertEqual(self.strategy.get_adaptive_order_size(min_size=1), 50)
+
     def test_update_unrealised_pnl_and_drawdown(self):
         self.strategy.inventory = 10
         self.strategy.avg_entry_price = 100
@@ -193,7 +184,8 @@ class TestBaseStrategy(unittest.TestCase):
         self.strategy.cooldown_period = 1
         self.strategy.cooldown_until = 0
         self.strategy.update_unrealised_pnl_and_drawdown()
-        self.assertTrue(self.strategy.cooldown_until > 0)
+        # Frozen clock (1000.0) plus the 1s cooldown period
+        self.assertEqual(self.strategy.cooldown_until, 1001.0)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,25 @@
+"""
+Unit tests for MomentumStrategy.
+
+PYTEST_DONT_REWRITE: only unittest assertions are used here.
+"""
+
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+from tests.Unit.strategies import _dummies
+from tests.Unit.strategies._dummies import (
+    BASE_ON_TRADE,
+    StrategyTestMixin,
+    make_logger_mock,
+)
 
-from strategies.base_strategy import BaseStrategy
-from strategies.competitor_strategy2 import MomentumStrategy
 
+class DummyOrderBook(_dummies.DummyOrderBook):
+    __slots__ = ()
 
-class DummyOrderBook:
     def __init__(self):
+        super().__init__()
         self.bids = {
             100: [{"qty": 500, "order_id": "bid1"}],
             99: [{"qty": 300, "order_id": "bid2"}],
@@ -15,7 +28,6 @@ class DummyOrderBook:
             101: [{"qty": 400, "order_id": "ask1"}],
             102: [{"qty": 200, "order_id": "ask2"}],
         }
-        self.last_price = 100.5
 
     def get_best_bid(self):
         return {"price": 100, "order_id": "bid1"}
@@ -27,43 +39,21 @@ class DummyOrderBook:
         # Return a list of prices for testing trend calculation
         return [100 + i for i in range(window)]
 
-    def get_mid_price(self):
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        if best_bid is None or best_ask is None:
-            return None
-        return (best_bid["price"] + best_ask["price"]) / 2
-
-
-class DummyFixEngine:
-    def create_new_order(self, **kwargs):
-        return {"fake": "msg"}
-
-    def parse(self, **kwargs):
-        return {
-            54: kwargs.get("side", "1"),
-            44: kwargs.get("price", 100),
-            38: kwargs.get("qty", 1),
-            11: "OID",
-        }
-
 
-class TestMomentumStrategy(unittest.TestCase):
-    def setUp(self):
-        self.fix_engine = DummyFixEngine()
-        self.order_book = DummyOrderBook()
-        self.symbol = "TEST"
-        self.params = {
+class TestMomentumStrategy(StrategyTestMixin, unittest.TestCase):
+    strategy_path = "strategies.competitor_strategy2.MomentumStrategy"
+    strategy_args = (
+        "TEST",
+        {
             "min_order_interval": 0.1,
             "max_inventory": 100,
             "lookback": 5,
             "base_spread": 0.002,
             "momentum_skew": 0.001,
             "size_skew": 2,
-        }
-        self.strategy = MomentumStrategy(
-            self.fix_engine, self.order_book, self.symbol, self.params
-        )
+        },
+    )
+    book_class = DummyOrderBook
 
     def test_initialization(self):
         self.assertEqual(self.strategy.max_inventory, 100)
@@ -92,83 +82,76 @@ class TestMomentumStrategy(unittest.TestCase):
     def test_risk_check_quantity_limit(self):
         self.assertFalse(self.strategy._risk_check("1", 100, 501))
 
-    @patch("time.time", return_value=1000)
-    @patch.object(MomentumStrategy, "place_order", return_value=True)
-    @patch.object(MomentumStrategy, "get_adaptive_order_size", return_value=5)
-    def test_generate_orders_normal(
-        self, mock_adaptive_size, mock_place_order, mock_time
-    ):
+    def test_generate_orders_normal(self):
+        self.strategy.place_order = lambda *a, **kw: True
+        self.strategy.get_adaptive_order_size = lambda *a, **kw: 5
         self.strategy.inventory = 0
         self.strategy.last_order_time = 900
         with patch("random.randint", return_value=3):
             orders = self.strategy.generate_orders()
         self.assertEqual(len(orders), 2)
-        self.assertEqual(orders[0]["side"], "1")
-        self.assertEqual(orders[1]["side"], "2")
-        self.assertTrue(1 <= orders[0]["quantity"] <= 10)
-        self.assertTrue(1 <= orders[1]["quantity"] <= 10)
+        self.assertEqual(orders[0].side, "1")
+        self.assertEqual(orders[1].side, "2")
+        self.assertTrue(1 <= orders[0].quantity <= 10)
+        self.assertTrue(1 <= orders[1].quantity <= 10)
 
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_cooldown(self, mock_time):
+    def test_generate_orders_cooldown(self):
         self.strategy.last_order_time = 999.95
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
 
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_not_enough_price_history(self, mock_time):
+    def test_generate_orders_not_enough_price_history(self):
         self.strategy.lookback = 10
-        self.strategy.order_book.get_recent_prices = MagicMock(return_value=[100, 101])
+        self.strategy.order_book.get_recent_prices = lambda window=0: [100, 101]
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
 
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_no_best_bid_ask(self, mock_time):
-        self.strategy.order_book.get_best_bid = MagicMock(return_value=None)
-        self.strategy.order_book.get_best_ask = MagicMock(return_value=None)
+    def test_generate_orders_no_best_bid_ask(self):
+        self.strategy.order_book.get_best_bid = lambda: None
+        self.strategy.order_book.get_best_ask = lambda: None
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
 
-    @patch("time.time", return_value=1000)
-    @patch.object(MomentumStrategy, "place_order", return_value=True)
-    def test_generate_orders_rebalance_pending_long(self, mock_place_order, mock_time):
+    def test_generate_orders_rebalance_pending_long(self):
+        self.strategy.place_order = lambda *a, **kw: True
         self.strategy.rebalance_pending = True
         self.strategy.inventory = 10
-        self.strategy.order_book.get_best_ask = MagicMock(
-            return_value={"price": 101, "order_id": "ask1"}
-        )
+        self.strategy.order_book.get_best_ask = lambda: {
+            "price": 101,
+            "order_id": "ask1",
+        }
         orders = self.strategy.generate_orders()
         self.assertEqual(len(orders), 1)
-        self.assertEqual(orders[0]["side"], "2")
-        self.assertEqual(orders[0]["price"], 101)
-        self.assertEqual(orders[0]["quantity"], 10)
-        self.assertEqual(orders[0]["order_id"], "ask1")
-
-    @patch("time.time", return_value=1000)
-    @patch.object(MomentumStrategy, "place_order", return_value=True)
-    def test_generate_orders_rebalance_pending_short(self, mock_place_order, mock_time):
+        self.assertEqual(orders[0].side, "2")
+        self.assertEqual(orders[0].price, 101)
+        self.assertEqual(orders[0].quantity, 10)
+        self.assertEqual(orders[0].order_id, "ask1")
+
+    def test_generate_orders_rebalance_pending_short(self):
+        self.strategy.place_order = lambda *a, **kw: True
         self.strategy.rebalance_pending = True
         self.strategy.inventory = -10
-        self.strategy.order_book.get_best_bid = MagicMock(
-            return_value={"price": 100, "order_id": "bid1"}
-        )
+        self.strategy.order_book.get_best_bid = lambda: {
+            "price": 100,
+            "order_id": "bid1",
+        }
         orders = self.strategy.generate_orders()
         self.assertEqual(len(orders), 1)
-        self.assertEqual(orders[0]["side"], "1")
-        self.assertEqual(orders[0]["price"], 100)
-        self.assertEqual(orders[0]["quantity"], 10)
-        self.assertEqual(orders[0]["order_id"], "bid1")
+        self.assertEqual(orders[0].side, "1")
+        self.assertEqual(orders[0].price, 100)
+        self.assertEqual(orders[0].quantity, 10)
+        self.assertEqual(orders[0].order_id, "bid1")
 
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_inventory_limit_sets_rebalance(self, mock_time):
+    def test_generate_orders_inventory_limit_sets_rebalance(self):
         self.strategy.inventory = 100
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
         self.assertTrue(self.strategy.rebalance_pending)
 
     def test_on_trade_calls_super_and_logs(self):
-        self.strategy.logger = MagicMock()
+        self.strategy.logger = make_logger_mock()
         trade = {"side": "1", "qty": 5, "price": 100}
-        with patch.object(BaseStrategy, "on_trade"):
+        with patch(BASE_ON_TRADE):
             self.strategy.on_trade(trade)
             self.strategy.logger.info.assert_called()
 
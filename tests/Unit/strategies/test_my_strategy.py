@@ -1,52 +1,29 @@
-import unittest
-from unittest.mock import MagicMock, patch
-
-from strategies.base_strategy import BaseStrategy
-from strategies.my_strategy import MyStrategy
-
-
-class DummyOrderBook:
-    def __init__(self):
-        self.bids = {100: [{"qty": 500}], 99: [{"qty": 300}]}
-        self.asks = {101: [{"qty": 400}], 102: [{"qty": 200}]}
-        self.last_price = 100.5
+"""
+Unit tests for MyStrategy.
 
-    def get_best_bid(self):
-        return {"price": 100}
+PYTEST_DONT_REWRITE: only unittest assertions are used here.
+"""
 
-    def get_best_ask(self):
-        return {"price": 101}
-
-    def get_mid_price(self):
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        if best_bid is None or best_ask is None:
-            return None
-        return (best_bid["price"] + best_ask["price"]) / 2
+import unittest
+from unittest.mock import patch
 
+from tests.Unit.strategies._dummies import (
+    BASE_ON_TRADE,
+    StrategyTestMixin,
+    make_logger_mock,
+)
 
-class DummyFixEngine:
-    def create_new_order(self, **kwargs):
-        return {"fake": "msg"}
 
-    def parse(self, **kwargs):
-        return {
-            54: kwargs.get("side", "1"),
-            44: kwargs.get("price", 100),
-            38: kwargs.get("qty", 1),
-            11: "OID",
-        }
+class TestMyStrategy(StrategyTestMixin, unittest.TestCase):
+    strategy_path = "strategies.my_strategy.MyStrategy"
+    strategy_args = ("TEST", {"min_order_interval": 0.1, "spread_factor": 0.01})
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from strategies.base_strategy import OrderTuple
 
-class TestMyStrategy(unittest.TestCase):
-    def setUp(self):
-        self.fix_engine = DummyFixEngine()
-        self.order_book = DummyOrderBook()
-        self.symbol = "TEST"
-        self.params = {"min_order_interval": 0.1, "spread_factor": 0.01}
-        self.strategy = MyStrategy(
-            self.fix_engine, self.order_book, self.symbol, self.params
-        )
+        cls.OrderTuple = OrderTuple
 
     def test_initialization(self):
         self.assertEqual(self.strategy.spread_factor, 0.01)
@@ -61,15 +38,20 @@ class TestMyStrategy(unittest.TestCase):
         self.strategy.inventory = -95
         self.assertFalse(self.strategy._risk_check("2", 100, 10))
 
+    def test_inventory_limit_only_bounds_direction_of_trade(self):
+        self.strategy.inventory = 120
+        self.assertTrue(self.strategy._within_inventory_limit("2", 10))
+        self.assertFalse(self.strategy._within_inventory_limit("1", 1))
+        self.strategy.inventory = -120
+        self.assertTrue(self.strategy._within_inventory_limit("1", 10))
+        self.assertFalse(self.strategy._within_inventory_limit("2", 1))
+
     def test_risk_check_quantity_limit(self):
         self.assertFalse(self.strategy._risk_check("1", 100, 501))
 
-    @patch("time.time", return_value=1000)
-    @patch.object(MyStrategy, "place_order", return_value=True)
-    @patch.object(MyStrategy, "get_adaptive_order_size", return_value=10)
-    def test_generate_orders_normal(
-        self, mock_adaptive_size, mock_place_order, mock_time
-    ):
+    def test_generate_orders_normal(self):
+        self.strategy.place_order = lambda *a, **kw: True
+        self.strategy.get_adaptive_order_size = lambda *a, **kw: 10
         self.strategy.inventory = 0
         self.strategy.last_order_time = 900
         with patch("random.randint", return_value=5):
@@ -77,61 +59,78 @@ class TestMyStrategy(unittest.TestCase):
         self.assertEqual(len(orders), 2)
         buy = orders[0]
         sell = orders[1]
-        self.assertEqual(buy["side"], "1")
-        self.assertEqual(sell["side"], "2")
-        self.assertAlmostEqual(buy["price"], 100 * (1 - 0.01))
-        self.assertAlmostEqual(sell["price"], 101 * (1 + 0.01))
-        self.assertEqual(buy["quantity"], 5)
-        self.assertEqual(sell["quantity"], 5)
-
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_cooldown(self, mock_time):
+        self.assertEqual(buy.side, "1")
+        self.assertEqual(sell.side, "2")
+        self.assertAlmostEqual(buy.price, 100 * (1 - 0.01))
+        self.assertAlmostEqual(sell.price, 101 * (1 + 0.01))
+        self.assertEqual(buy.quantity, 5)
+        self.assertEqual(sell.quantity, 5)
+
+    def test_generate_orders_drops_leg_over_inventory_limit(self):
+        self.strategy.place_order = lambda *a, **kw: True
+        self.strategy.get_adaptive_order_size = lambda *a, **kw: 10
+        self.strategy.inventory = 97
+        self.strategy.last_order_time = 900
+        with patch("random.randint", return_value=5):
+            orders = self.strategy.generate_orders()
+        # Buying 5 would take inventory to 102; the same check _risk_check applies
+        self.assertFalse(self.strategy._within_inventory_limit("1", 5))
+        self.assertEqual([order.side for order in orders], ["2"])
+
+    def test_generate_orders_returns_order_tuples(self):
+        self.strategy.place_order = lambda *a, **kw: True
+        self.strategy.get_adaptive_order_size = lambda *a, **kw: 10
+        self.strategy.last_order_time = 900
+        orders = self.strategy.generate_orders()
+        for order in orders:
+            self.assertIsInstance(order, self.OrderTuple)
+        self.assertEqual(
+            set(orders[0]._asdict()), {"side", "price", "quantity", "order_id"}
+        )
+
+    def test_generate_orders_cooldown(self):
         self.strategy.last_order_time = 999.95
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
 
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_no_best_bid_ask(self, mock_time):
-        self.strategy.order_book.get_best_bid = MagicMock(return_value=None)
-        self.strategy.order_book.get_best_ask = MagicMock(return_value=None)
+    def test_generate_orders_no_best_bid_ask(self):
+        self.strategy.order_book.get_best_bid = lambda: None
+        self.strategy.order_book.get_best_ask = lambda: None
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
 
-    @patch("time.time", return_value=1000)
-    @patch.object(MyStrategy, "place_order", return_value=True)
-    def test_generate_orders_rebalance_pending_long(self, mock_place_order, mock_time):
+    def test_generate_orders_rebalance_pending_long(self):
+        self.strategy.place_order = lambda *a, **kw: True
         self.strategy.rebalance_pending = True
         self.strategy.inventory = 10
-        self.strategy.order_book.get_best_ask = MagicMock(return_value={"price": 101})
+        self.strategy.order_book.get_best_ask = lambda: {"price": 101}
         orders = self.strategy.generate_orders()
         self.assertEqual(len(orders), 1)
-        self.assertEqual(orders[0]["side"], "2")
-        self.assertEqual(orders[0]["price"], 101)
-        self.assertEqual(orders[0]["quantity"], 10)
+        self.assertEqual(orders[0].side, "2")
+        self.assertEqual(orders[0].price, 101)
+        self.assertEqual(orders[0].quantity, 10)
 
-    @patch("time.time", return_value=1000)
-    @patch.object(MyStrategy, "place_order", return_value=True)
-    def test_generate_orders_rebalance_pending_short(self, mock_place_order, mock_time):
+    def test_generate_orders_rebalance_pending_short(self):
+        self.strategy.place_order = lambda *a, **kw: True
         self.strategy.rebalance_pending = True
         self.strategy.inventory = -10
-        self.strategy.order_book.get_best_bid = MagicMock(return_value={"price": 100})
+        self.strategy.order_book.get_best_bid = lambda: {"price": 100}
         orders = self.strategy.generate_orders()
         self.assertEqual(len(orders), 1)
-        self.assertEqual(orders[0]["side"], "1")
-        self.assertEqual(orders[0]["price"], 100)
-        self.assertEqual(orders[0]["quantity"], 10)
+        self.assertEqual(orders[0].side, "1")
+        self.assertEqual(orders[0].price, 100)
+        self.assertEqual(orders[0].quantity, 10)
 
-    @patch("time.time", return_value=1000)
-    def test_generate_orders_inventory_limit_sets_rebalance(self, mock_time):
+    def test_generate_orders_inventory_limit_sets_rebalance(self):
         self.strategy.inventory = 100
         orders = self.strategy.generate_orders()
         self.assertEqual(orders, [])
         self.assertTrue(self.strategy.rebalance_pending)
 
     def test_on_trade_calls_super_and_logs(self):
-        self.strategy.logger = MagicMock()
+        self.strategy.logger = make_logger_mock()
         trade = {"side": "1", "qty": 5, "price": 100}
-        with patch.object(BaseStrategy, "on_trade"):
+        with patch(BASE_ON_TRADE):
             self.strategy.on_trade(trade)
             self.strategy.logger.info.assert_called()
 
@@ -0,0 +1,60 @@
+"""
+Deterministic stand-in for the time module's clocks, shared by the Unit and System suites.
+"""
+
+import time
+
+
+class FakeClock:
+    """
+    Manually advanced clock that replaces time.time, time.time_ns, time.monotonic
+    and time.monotonic_ns while installed, so time-dependent code never needs a
+    real sleep. All four readings move together from a single float.
+    """
+
+    _PATCHED = ("time", "time_ns", "monotonic", "monotonic_ns")
+
+    def __init__(self, start=1000.0):
+        """
+        Args:
+            start (float): Initial reading in seconds.
+        """
+        self.now = float(start)
+        self._originals = None
+
+    def time(self):
+        return self.now
+
+    def time_ns(self):
+        return int(self.now * 1e9)
+
+    monotonic = time
+    monotonic_ns = time_ns
+
+    def advance(self, seconds):
+        """
+        Move the clock forward instead of sleeping.
+        Args:
+            seconds (float): Amount to advance by.
+        """
+        self.now += seconds
+
+    def install(self):
+        """Swap the clock into the time module; pair with uninstall()."""
+        self._originals = {name: getattr(time, name) for name in self._PATCHED}
+        for name in self._PATCHED:
+            setattr(time, name, getattr(self, name))
+        return self
+
+    def uninstall(self):
+        """Restore the real time functions saved by install()."""
+        for name, func in self._originals.items():
+            setattr(time, name, func)
+        self._originals = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+        return False
@@ -0,0 +1,22 @@
+"""
+No-op lock shared by the Unit suites that patch out threading locks.
+"""
+
+
+class _NullLock:
+    """No-op stand-in for threading.Lock, usable as a context manager or directly."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def acquire(self, *args, **kwargs):
+        return True
+
+    def release(self):
+        pass
+
+
+NULL_LOCK = _NullLock()